@@ -4,8 +4,9 @@ Abstract base class for all AOIA sub-agents.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from datetime import datetime
+import time
 import uuid
 import logging
 
@@ -18,8 +19,13 @@ class BaseAgent(ABC):
     - Logging and metrics tracking
     - Inter-agent communication interface
     - Standard lifecycle methods
+    
+    Set profiling_enabled to False (per class or per instance) to skip
+    status and metrics bookkeeping on hot paths.
     """
     
+    profiling_enabled: bool = True
+    
     def __init__(self, agent_name: str):
         self.agent_name = agent_name
         self.agent_id = f"{agent_name}-{uuid.uuid4().hex[:8]}"
@@ -74,30 +80,88 @@ class BaseAgent(ABC):
         self._message_queue.clear()
         return messages
     
-    def _start_processing(self) -> datetime:
-        """Mark processing start and return start time."""
-        self._status = "processing"
-        self.metrics["total_runs"] += 1
-        return datetime.now()
+    def _start_processing(self) -> float:
+        """Mark processing start and return the start time (perf_counter seconds)."""
+        if self.profiling_enabled:
+            self._status = "processing"
+            self.metrics["total_runs"] += 1
+        return time.perf_counter()
     
-    def _complete_processing(self, start_time: datetime, success: bool = True) -> None:
+    def _complete_processing(self, start_time: float, success: bool = True) -> None:
         """Mark processing complete and update metrics."""
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds() * 1000
+        if not self.profiling_enabled:
+            return
+        processing_time = (time.perf_counter() - start_time) * 1000
         
         self._status = "idle"
         self.metrics["total_processing_time_ms"] += processing_time
-        self.metrics["last_run"] = end_time.isoformat()
+        self.metrics["last_run"] = datetime.now().isoformat()
         
         if success:
             self.metrics["successful_runs"] += 1
         else:
             self.metrics["failed_runs"] += 1
     
+    def _map_isolated(
+        self, fn: Callable[[Dict[str, Any]], Dict[str, Any]], items: List[Dict[str, Any]], context: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+        """
+        Apply fn to every item of a batch, one at a time.
+        
+        A failing item is logged, yields an empty result and has its error
+        recorded under its position, so it never fails the other items.
+        """
+        results: List[Dict[str, Any]] = []
+        errors: Dict[int, str] = {}
+        for i, item in enumerate(items):
+            try:
+                results.append(fn(item))
+            except Exception as e:
+                self._log_error(e, context)
+                errors[i] = str(e)
+                results.append({})
+        return results, errors
+    
+    def _map_batch(
+        self,
+        items: List[Dict[str, Any]],
+        vectorized: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        scalar: Callable[[Dict[str, Any]], Dict[str, Any]],
+        needs_scalar: Callable[[Dict[str, Any]], bool],
+        context: str,
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+        """
+        Run a batch through vectorized(), except for items needs_scalar()
+        flags (values the column arrays can't hold, such as None). Those
+        go through scalar() one at a time via _map_isolated(), so they get
+        the same result or error as a single-item call. If vectorized()
+        still raises, its items are rerun the same way, so one item's bad
+        data only ever fails that item.
+        """
+        skip = {i for i, item in enumerate(items) if needs_scalar(item)}
+        regular = [i for i in range(len(items)) if i not in skip]
+        flagged = sorted(skip)
+        results: List[Dict[str, Any]] = [{} for _ in items]
+        
+        if regular:
+            try:
+                vectorized_results = vectorized([items[i] for i in regular])
+            except Exception as e:
+                self._log_error(e, f"{context} (vectorized, retrying per item)")
+                flagged = list(range(len(items)))
+            else:
+                for i, result in zip(regular, vectorized_results):
+                    results[i] = result
+        
+        scalar_results, scalar_errors = self._map_isolated(scalar, [items[i] for i in flagged], context)
+        for i, result in zip(flagged, scalar_results):
+            results[i] = result
+        return results, {flagged[k]: error for k, error in scalar_errors.items()}
+    
     def _log_error(self, error: Exception, context: str = "") -> None:
         """Log an error with context."""
-        self.logger.error(f"[{self.agent_name}] {context}: {str(error)}")
+        self.logger.error("[%s] %s: %s", self.agent_name, context, error)
     
     def _log_info(self, message: str) -> None:
         """Log an info message."""
-        self.logger.info(f"[{self.agent_name}] {message}")
+        self.logger.info("[%s] %s", self.agent_name, message)
@@ -6,10 +6,11 @@ Works for: BPO, SaaS, Retail, Healthcare, Logistics, Agencies, HR, Finance, etc.
 """
 
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+import time
 import uuid
 
 from app.agents.base_agent import BaseAgent
+from app.models.clock import now
 from app.models.output_schemas import InefficiencyDetection, SeverityLevel
 
 
@@ -115,13 +116,14 @@ class DetectionAgent(BaseAgent):
                 detections.extend(pattern_detections)
             
             self._complete_processing(start_time, success=True)
-            self._last_output = {"detections": [d.model_dump() for d in detections]}
+            dumped = [d.model_dump() for d in detections]
+            self._last_output = {"detections": dumped}
             
             return {
                 "status": "success",
-                "detections": [d.model_dump() for d in detections],
+                "detections": dumped,
                 "count": len(detections),
-                "processing_time_ms": (datetime.now() - start_time).total_seconds() * 1000,
+                "processing_time_ms": (time.perf_counter() - start_time) * 1000,
             }
             
         except Exception as e:
@@ -456,6 +458,7 @@ class DetectionAgent(BaseAgent):
             else SeverityLevel.HIGH if severity < 0.85
             else SeverityLevel.CRITICAL
         )
+        stamp = now()
         
         return InefficiencyDetection(
             detection_id=f"det-{uuid.uuid4().hex[:12]}",
@@ -465,12 +468,12 @@ class DetectionAgent(BaseAgent):
             location_name=location_name,
             severity_score=severity,
             severity_level=severity_level,
-            time_window={"start": datetime.now(), "end": datetime.now()},
+            time_window={"start": stamp, "end": stamp},
             deviation_percent=deviation,
             current_value=current_value,
             expected_value=expected_value,
             description=description,
-            timestamp=datetime.now(),
+            timestamp=stamp,
         )
     
     def update_thresholds(self, new_thresholds: Dict[str, float]) -> None:
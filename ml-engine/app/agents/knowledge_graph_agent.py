@@ -5,6 +5,7 @@ Builds operational dependency maps for impact analysis.
 
 from typing import Dict, Any, Optional, List, Set
 from datetime import datetime
+import time
 import uuid
 
 from app.agents.base_agent import BaseAgent
@@ -77,7 +78,7 @@ class KnowledgeGraphAgent(BaseAgent):
                     "operators": len(self.type_index.get("operator", set())),
                     "tasks": len(self.type_index.get("task", set())),
                 },
-                "processing_time_ms": (datetime.now() - start_time).total_seconds() * 1000,
+                "processing_time_ms": (time.perf_counter() - start_time) * 1000,
             }
             
             if affected_analysis:
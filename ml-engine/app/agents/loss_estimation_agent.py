@@ -5,10 +5,11 @@ Computes monetary impact of operational inefficiencies.
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import time
 import uuid
 
 from app.agents.base_agent import BaseAgent
-from app.services.loss_calculator import LossCalculator
+from app.services.loss_calculator import LossCalculator, sum_by_key
 from app.models.output_schemas import FinancialLoss, LossBreakdown
 
 
@@ -59,8 +60,6 @@ class LossEstimationAgent(BaseAgent):
             # Calculate losses for each detection
             individual_losses = []
             total_loss = 0
-            by_type: Dict[str, float] = {}
-            by_source: Dict[str, float] = {}
             
             for detection in detections:
                 loss_result = self._calculate_detection_loss(
@@ -68,14 +67,11 @@ class LossEstimationAgent(BaseAgent):
                 )
                 individual_losses.append(loss_result)
                 total_loss += loss_result["estimated_loss"]
-                
-                # Aggregate by type
-                atype = detection.get("anomaly_type", "UNKNOWN")
-                by_type[atype] = by_type.get(atype, 0) + loss_result["estimated_loss"]
-                
-                # Aggregate by source
-                source = detection.get("anomaly_location", "unknown")
-                by_source[source] = by_source.get(source, 0) + loss_result["estimated_loss"]
+            
+            # Aggregate by type and by source in one grouped sum each
+            losses = [loss["estimated_loss"] for loss in individual_losses]
+            by_type = sum_by_key([d.get("anomaly_type", "UNKNOWN") for d in detections], losses)
+            by_source = sum_by_key([d.get("anomaly_location", "unknown") for d in detections], losses)
             
             # Calculate projections
             duration_mins = self._estimate_total_duration(detections)
@@ -124,7 +120,7 @@ class LossEstimationAgent(BaseAgent):
                 "status": "success",
                 "financial_loss": financial_loss.model_dump(),
                 "individual_losses": individual_losses,
-                "processing_time_ms": (datetime.now() - start_time).total_seconds() * 1000,
+                "processing_time_ms": (time.perf_counter() - start_time) * 1000,
             }
             
         except Exception as e:
@@ -5,7 +5,7 @@ AOIA ML Engine - Analysis API (Loss Calculation & Root Cause)
 from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
-from app.services.loss_calculator import LossCalculator
+from app.services.loss_calculator import LossCalculator, sum_by_key
 from app.services.root_cause_analyzer import RootCauseAnalyzer
 
 router = APIRouter()
@@ -92,9 +92,7 @@ async def assess_impact(
     """
     Assess the total impact of multiple anomalies over a time period.
     """
-    total_loss = 0
-    by_type = {}
-    by_source = {}
+    losses = []
     
     for anomaly in anomalies:
         loss = loss_calc.calculate(
@@ -105,22 +103,24 @@ async def assess_impact(
             cost_per_minute=cost_per_minute,
             industry="MANUFACTURING",
         )
-        
-        loss_amount = loss["estimated_loss"]
-        total_loss += loss_amount
-        
-        atype = anomaly.get("anomaly_type", "UNKNOWN")
-        source = anomaly.get("source", "unknown")
-        
-        by_type[atype] = by_type.get(atype, 0) + loss_amount
-        by_source[source] = by_source.get(source, 0) + loss_amount
+        losses.append(loss["estimated_loss"])
+    
+    by_type = sorted(
+        sum_by_key([a.get("anomaly_type", "UNKNOWN") for a in anomalies], losses).items(),
+        key=lambda x: -x[1],
+    )
+    # Stable sort: the first entry is the earliest-seen largest source
+    by_source = sorted(
+        sum_by_key([a.get("source", "unknown") for a in anomalies], losses).items(),
+        key=lambda x: -x[1],
+    )
     
     return {
         "time_range_hours": time_range_hours,
-        "total_loss": round(total_loss, 2),
+        "total_loss": round(sum(losses), 2),
         "currency": "INR",
         "anomaly_count": len(anomalies),
-        "by_type": {k: round(v, 2) for k, v in sorted(by_type.items(), key=lambda x: -x[1])},
-        "by_source": {k: round(v, 2) for k, v in sorted(by_source.items(), key=lambda x: -x[1])},
-        "top_contributor": max(by_source.items(), key=lambda x: x[1])[0] if by_source else None,
+        "by_type": {k: round(v, 2) for k, v in by_type},
+        "by_source": {k: round(v, 2) for k, v in by_source},
+        "top_contributor": by_source[0][0] if by_source else None,
     }
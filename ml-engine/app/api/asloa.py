@@ -4,8 +4,8 @@ Sales automation pipeline API.
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List, Literal
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 from app.asloa.orchestrator import ASLOAOrchestrator
@@ -40,22 +40,21 @@ class LeadInput(BaseModel):
     funding_raised: Optional[bool] = Field(False)
     hiring: Optional[bool] = Field(False)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "company": "TechCorp Inc",
-                "company_size": 250,
-                "industry": "saas",
-                "contact_name": "John Smith",
-                "contact_title": "VP of Engineering",
-                "contact_email": "john@techcorp.com",
-                "source": "linkedin",
-                "budget": 75000,
-                "deal_size_estimate": 100000,
-                "pain_points": ["Developer productivity", "Deployment speed"],
-                "timeline": 60,
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "company": "TechCorp Inc",
+            "company_size": 250,
+            "industry": "saas",
+            "contact_name": "John Smith",
+            "contact_title": "VP of Engineering",
+            "contact_email": "john@techcorp.com",
+            "source": "linkedin",
+            "budget": 75000,
+            "deal_size_estimate": 100000,
+            "pain_points": ["Developer productivity", "Deployment speed"],
+            "timeline": 60,
         }
+    })
 
 
 class LeadProcessResponse(BaseModel):
@@ -107,6 +106,26 @@ async def process_lead(lead: LeadInput) -> LeadProcessResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/process-leads")
+async def process_leads(
+    leads: List[LeadInput], detail_level: Literal["summary", "full"] = "full"
+) -> List[Dict[str, Any]]:
+    """
+    Process a burst of leads through the ASLOA pipeline in one batch.
+    
+    Each result has the same shape as /process-lead; the scoring,
+    qualification, research, routing and analytics stages run once
+    for the whole batch. detail_level=summary trims each result to its
+    summary and assigned rep (for list views).
+    """
+    try:
+        return orchestrator.process_leads_batch(
+            [lead.model_dump() for lead in leads], detail_level
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/dashboard")
 async def get_dashboard() -> Dict[str, Any]:
     """
@@ -3,12 +3,13 @@ AOIA ML Engine - Demo API Endpoints
 Provides demonstration scenarios for the prototype UI.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
 from datetime import datetime
 
 from app.orchestrator import AOIAOrchestrator
+from app.api.server_timing import server_timing_header
 
 
 router = APIRouter(prefix="/demo", tags=["demonstrations"])
@@ -33,10 +34,11 @@ class DemoResponse(BaseModel):
     summary: Dict[str, Any]
     
     processing_time_ms: float
+    stage_timings_ms: Dict[str, float] = {}
 
 
 @router.post("/bpo-sla-prevention")
-async def run_bpo_demo() -> DemoResponse:
+async def run_bpo_demo(response: Response) -> DemoResponse:
     """
     Run the BPO Ticket Delay & SLA Violation Prevention demo.
     
@@ -138,6 +140,7 @@ async def run_bpo_demo() -> DemoResponse:
         }
         
         result = orchestrator.run_pipeline(input_data)
+        format_start = datetime.now()
         
         # ===================================================
         # FORMAT DETECTION OUTPUT
@@ -280,7 +283,13 @@ async def run_bpo_demo() -> DemoResponse:
             },
         }
         
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        end_time = datetime.now()
+        processing_time = (end_time - start_time).total_seconds() * 1000
+        stage_times = {
+            **result.stage_timings_ms,
+            "format": (end_time - format_start).total_seconds() * 1000,
+        }
+        response.headers["Server-Timing"] = server_timing_header(stage_times)
         
         return DemoResponse(
             scenario_name="BPO Ticket Delay & SLA Violation Prevention",
@@ -293,6 +302,7 @@ async def run_bpo_demo() -> DemoResponse:
             execution=execution,
             summary=summary,
             processing_time_ms=processing_time,
+            stage_timings_ms=stage_times,
         )
         
     except Exception as e:
@@ -44,6 +44,7 @@ class DetectionResponse(BaseModel):
 async def detect_anomalies_batch(request: DetectionRequest):
     """
     Detect anomalies in a batch of metrics using Isolation Forest.
+    Metrics inside their static threshold band are treated as normal without scoring.
     """
     if not request.metrics:
         raise HTTPException(status_code=400, detail="No metrics provided")
@@ -63,7 +64,8 @@ async def detect_anomalies_batch(request: DetectionRequest):
 async def detect_realtime(metric: MetricData, context: Optional[List[float]] = None):
     """
     Real-time single metric anomaly detection.
-    Uses recent context for comparison if provided.
+    Uses recent context for comparison if provided. Always runs the full
+    single-metric path (no in-band short-circuit).
     """
     result = detector.detect_single(metric, context or [])
     
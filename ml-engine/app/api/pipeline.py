@@ -3,13 +3,15 @@ AOIA ML Engine - Pipeline API
 Unified endpoint for running the AOIA autonomous pipeline.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 
 from app.orchestrator import AOIAOrchestrator, AutonomyMode
 from app.models.input_schemas import AOIAInput
 from app.models.output_schemas import AOIAOutput
+from app.api.server_timing import server_timing_header
+from app.models.clock import start_batch
 
 
 router = APIRouter(prefix="/pipeline", tags=["pipeline"])
@@ -30,8 +32,13 @@ class PipelineStatusResponse(BaseModel):
     agents: Dict[str, Any]
 
 
-@router.post("/run", response_model=AOIAOutput)
-async def run_pipeline(input_data: AOIAInput) -> AOIAOutput:
+async def batch_clock() -> None:
+    """Share one timestamp across every model built for this request."""
+    start_batch()
+
+
+@router.post("/run", response_model=AOIAOutput, dependencies=[Depends(batch_clock)])
+async def run_pipeline(input_data: AOIAInput) -> Response:
     """
     Run the complete AOIA autonomous pipeline.
     
@@ -57,13 +64,22 @@ async def run_pipeline(input_data: AOIAInput) -> AOIAOutput:
     - optimization_plan: Recommended actions
     - actions_executed: Execution results
     - updated_baselines: Learning updates
+    
+    Per-stage latency is returned in stage_timings_ms and the
+    Server-Timing header. The orchestrator already returns a validated
+    AOIAOutput, so it is serialized straight to JSON by pydantic-core
+    rather than re-validated against the response model.
     """
     try:
         result = orchestrator.run_pipeline(
             input_data=input_data.model_dump(),
             dry_run=input_data.dry_run or False
         )
-        return result
+        return Response(
+            content=result.model_dump_json(),
+            media_type="application/json",
+            headers={"Server-Timing": server_timing_header(result.stage_timings_ms)},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -0,0 +1,11 @@
+"""
+AOIA ML Engine - Server-Timing Helpers
+Formats per-stage latency for the Server-Timing response header.
+"""
+
+from typing import Dict
+
+
+def server_timing_header(stage_times: Dict[str, float]) -> str:
+    """Format stage durations (ms) as a Server-Timing header value."""
+    return ", ".join(f"{stage};dur={ms:.1f}" for stage, ms in stage_times.items())
@@ -0,0 +1,138 @@
+"""
+ASLOA - Numeric Kernels
+Batch scoring math shared by the ASLOA agents.
+
+Numba is optional (pip install .[jit]); without it the same math runs
+as plain NumPy expressions.
+"""
+
+from typing import Tuple
+import os
+
+import numpy as np
+
+try:
+    from numba import config, njit, prange
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
+else:
+    # The kernels also run on worker threads (orchestrator pool, FastAPI);
+    # a TBB pool first started off the main thread hangs interpreter exit,
+    # so prefer OpenMP unless the environment picks a layer.
+    if "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+        config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+
+if njit is not None:
+    
+    @njit(cache=True, parallel=True)
+    def score_batch(
+        scores: np.ndarray,
+        tier_idx: np.ndarray,
+        qual_idx: np.ndarray,
+        deal_value: np.ndarray,
+        tier_mul: np.ndarray,
+        qual_mul: np.ndarray,
+        qual_prob: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Conversion probability (capped at 50%) and weighted deal value per lead."""
+        n = scores.shape[0]
+        prob = np.empty(n)
+        weighted = np.empty(n)
+        for i in prange(n):
+            p = scores[i] / 100 * 0.1 * tier_mul[tier_idx[i]] * qual_mul[qual_idx[i]]
+            prob[i] = min(p, 0.50)
+            weighted[i] = deal_value[i] * qual_prob[qual_idx[i]]
+        return prob, weighted
+    
+    @njit(cache=True, parallel=True)
+    def tally_engagement(
+        masks: np.ndarray, source_scores: np.ndarray, weights: np.ndarray
+    ) -> np.ndarray:
+        """Engagement score (capped at 20) from source points plus signal-mask weights."""
+        n = masks.shape[0]
+        out = np.empty(n, dtype=np.int64)
+        for i in prange(n):
+            out[i] = min(source_scores[i] + weights[masks[i]], 20)
+        return out
+    
+    @njit(cache=True)
+    def score_reps(
+        capacity_score: np.ndarray,
+        win_rate_score: np.ndarray,
+        avg_deal_size: np.ndarray,
+        specialties: np.ndarray,
+        territories: np.ndarray,
+        deal_size: float,
+        industry_bit: int,
+        segment_bit: int,
+        territory_bits: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-rep routing score components (capacity, expertise, win rate, deal fit, territory) and totals."""
+        n = capacity_score.shape[0]
+        components = np.empty((5, n), dtype=np.int64)
+        total = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            expertise = 0
+            if specialties[i] & industry_bit:
+                expertise += 15
+            if specialties[i] & segment_bit:
+                expertise += 10
+            ratio = min(deal_size, avg_deal_size[i]) / max(deal_size, avg_deal_size[i])
+            in_territory = (territories[i] & territory_bits) != 0
+            components[0, i] = capacity_score[i]
+            components[1, i] = expertise
+            components[2, i] = win_rate_score[i]
+            components[3, i] = np.int64(ratio * 15)
+            components[4, i] = 15 if in_territory else 5
+            total[i] = (
+                components[0, i] + components[1, i] + components[2, i]
+                + components[3, i] + components[4, i]
+            )
+        return components, total
+
+else:
+    
+    def score_batch(
+        scores: np.ndarray,
+        tier_idx: np.ndarray,
+        qual_idx: np.ndarray,
+        deal_value: np.ndarray,
+        tier_mul: np.ndarray,
+        qual_mul: np.ndarray,
+        qual_prob: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Conversion probability (capped at 50%) and weighted deal value per lead."""
+        prob = np.minimum(scores / 100 * 0.1 * tier_mul[tier_idx] * qual_mul[qual_idx], 0.50)
+        weighted = deal_value * qual_prob[qual_idx]
+        return prob, weighted
+    
+    def tally_engagement(
+        masks: np.ndarray, source_scores: np.ndarray, weights: np.ndarray
+    ) -> np.ndarray:
+        """Engagement score (capped at 20) from source points plus signal-mask weights."""
+        return np.minimum(source_scores + weights[masks], 20)
+    
+    def score_reps(
+        capacity_score: np.ndarray,
+        win_rate_score: np.ndarray,
+        avg_deal_size: np.ndarray,
+        specialties: np.ndarray,
+        territories: np.ndarray,
+        deal_size: float,
+        industry_bit: int,
+        segment_bit: int,
+        territory_bits: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-rep routing score components (capacity, expertise, win rate, deal fit, territory) and totals."""
+        expertise = 15 * ((specialties & industry_bit) != 0) + 10 * ((specialties & segment_bit) != 0)
+        ratio = np.minimum(deal_size, avg_deal_size) / np.maximum(deal_size, avg_deal_size)
+        in_territory = (territories & territory_bits) != 0
+        components = np.stack([
+            capacity_score,
+            expertise,
+            win_rate_score,
+            (ratio * 15).astype(np.int64),
+            np.where(in_territory, 15, 5),
+        ])
+        return components, components.sum(axis=0)
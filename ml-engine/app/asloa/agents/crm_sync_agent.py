@@ -10,11 +10,126 @@ Capabilities:
 - Notification triggers
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator, Deque
+from collections import OrderedDict, deque
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-import uuid
+from types import MappingProxyType
+import os
 
 from app.agents.base_agent import BaseAgent
+from app.asloa.clock import NOW
+from app.asloa.tiers import LeadTier
+
+
+# Shared read-only fallback for missing nested sections
+_EMPTY = MappingProxyType({})
+
+# Initial outreach task due offset and priority, indexed by LeadTier
+_TASK_DUE = (timedelta(hours=24), timedelta(hours=2), timedelta(minutes=5))
+_TASK_PRIORITY = ("normal", "high", "urgent")
+
+# Activities logged per sync: (input key that triggers it, activity type, description)
+_ACTIVITY_SPECS = (
+    ("score", "lead_scored",
+     lambda d: f"ASLOA scored lead at {d.get('score', 0)}/100 ({d.get('lead_tier', 'COLD')})"),
+    ("qualification", "lead_qualified",
+     lambda d: f"BANT qualification: {d['qualification'].get('qualification_status', 'UNKNOWN')}"),
+    ("routing", "lead_routed",
+     lambda d: f"Assigned to {d['routing'].get('assigned_to', {}).get('name', 'rep')}"),
+    ("outreach", "email_drafted",
+     lambda d: "ASLOA generated personalized outreach email"),
+)
+
+# Currency formatter for notification titles, bound once
+_FMT_USD_EXACT = "${:,}".format
+
+# Retention limits for the in-memory CRM stores (oldest entries are dropped)
+_MAX_CRM_RECORDS = 10_000
+_MAX_TASKS = 10_000
+_MAX_ACTIVITIES = 50_000
+_MAX_NOTIFICATIONS = 10_000
+
+# Upper bound on IDs one sync can mint: lead + 2 tasks + 4 activities + 2 notifications
+_MAX_IDS_PER_SYNC = 9
+
+
+def _id_tokens(count: int) -> Iterator[str]:
+    """Yield `count` 8-char hex ID suffixes from a single os.urandom read."""
+    raw = os.urandom(4 * count).hex()
+    return (raw[i:i + 8] for i in range(0, len(raw), 8))
+
+
+# ============================================
+# CRM RECORD TYPES (slotted; converted to dicts only when returned)
+# ============================================
+
+@dataclass(slots=True)
+class LeadRecord:
+    """Lead record as stored in the CRM."""
+    id: str
+    company: str
+    contact: Dict[str, Any]
+    score: int
+    tier: str
+    qualification_status: str
+    assigned_to: Dict[str, Any]
+    stage: str
+    source: str
+    industry: str
+    company_size: int
+    deal_value: float
+    created_at: str
+    updated_at: str
+    type: str = "lead"
+    asloa_processed: bool = True
+
+
+@dataclass(slots=True)
+class TaskRecord:
+    """Follow-up task assigned to a rep."""
+    task_id: str
+    type: str
+    title: str
+    assigned_to: str
+    lead_id: str
+    due_at: str
+    priority: str
+    status: str = "pending"
+    description: Optional[str] = None
+    depends_on: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form; optional fields are left out when unset."""
+        data = asdict(self)
+        for key in ("description", "depends_on"):
+            if data[key] is None:
+                del data[key]
+        return data
+
+
+@dataclass(slots=True)
+class ActivityRecord:
+    """Automated activity logged against a lead."""
+    activity_id: str
+    type: str
+    lead_id: str
+    description: str
+    timestamp: str
+    automated: bool = True
+
+
+@dataclass(slots=True)
+class NotificationRecord:
+    """Notification sent to a rep or manager."""
+    notification_id: str
+    type: str
+    recipient: str
+    title: str
+    body: str
+    lead_id: str
+    priority: str
+    sent_at: str
 
 
 class CRMSyncAgent(BaseAgent):
@@ -29,10 +144,10 @@ class CRMSyncAgent(BaseAgent):
         super().__init__("crm_sync")
         
         # Simulated CRM (in production, this would be API calls)
-        self.crm_records: Dict[str, Any] = {}
-        self.tasks: List[Dict] = []
-        self.activities: List[Dict] = []
-        self.notifications: List[Dict] = []
+        self.crm_records: "OrderedDict[str, LeadRecord]" = OrderedDict()
+        self.tasks: Deque[TaskRecord] = deque(maxlen=_MAX_TASKS)
+        self.activities: Deque[ActivityRecord] = deque(maxlen=_MAX_ACTIVITIES)
+        self.notifications: Deque[NotificationRecord] = deque(maxlen=_MAX_NOTIFICATIONS)
     
     def process(
         self,
@@ -57,22 +172,39 @@ class CRMSyncAgent(BaseAgent):
         start_time = self._start_processing()
         
         try:
-            lead_id = input_data.get("lead_id", f"lead-{uuid.uuid4().hex[:8]}")
+            ids = _id_tokens(_MAX_IDS_PER_SYNC)
+            lead_id = input_data.get("lead_id", f"lead-{next(ids)}")
+            
+            # Records share the cached stamp; ``now`` is only for due dates
+            now = datetime.now()
+            now_iso = NOW.get()
+            
+            # Resolve nested sections once; helpers take the resolved values
+            tier = LeadTier.from_string(input_data.get("lead_tier", "COLD"))
+            qualification = input_data.get("qualification") or _EMPTY
+            qual_status = qualification.get("qualification_status", "PENDING")
+            routing = input_data.get("routing") or _EMPTY
+            # Kept as a real dict: it is stored on the lead record
+            assigned_to = routing.get("assigned_to") or {}
             
             # Create or update lead record
-            lead_record = self._create_or_update_lead(lead_id, input_data)
+            lead_record = self._create_or_update_lead(
+                lead_id, input_data, qual_status, assigned_to, now_iso
+            )
             
             # Create tasks for assigned rep
-            tasks_created = self._create_tasks(lead_id, input_data)
+            tasks_created = self._create_tasks(lead_id, input_data, tier, assigned_to, now, ids)
             
             # Log activities
-            activities_logged = self._log_activities(lead_id, input_data)
+            activities_logged = self._log_activities(lead_id, input_data, now_iso, ids)
             
             # Send notifications
-            notifications_sent = self._send_notifications(lead_id, input_data)
+            notifications_sent = self._send_notifications(
+                lead_id, input_data, tier, assigned_to, now_iso, ids
+            )
             
             # Update pipeline
-            pipeline_update = self._update_pipeline(lead_id, input_data)
+            pipeline_update = self._update_pipeline(lead_id, input_data, qual_status, now_iso)
             
             result = {
                 "lead_id": lead_id,
@@ -82,7 +214,7 @@ class CRMSyncAgent(BaseAgent):
                 "notifications_sent": notifications_sent,
                 "pipeline_update": pipeline_update,
                 "sync_status": "success",
-                "synced_at": datetime.now().isoformat(),
+                "synced_at": now_iso,
             }
             
             self._complete_processing(start_time, success=True)
@@ -98,201 +230,157 @@ class CRMSyncAgent(BaseAgent):
             self._complete_processing(start_time, success=False)
             return {"status": "error", "error": str(e)}
     
-    def _create_or_update_lead(self, lead_id: str, data: Dict) -> Dict[str, Any]:
+    def _create_or_update_lead(
+        self, lead_id: str, data: Dict, qual_status: str, assigned_to: Dict, now_iso: str
+    ) -> Dict[str, Any]:
         """Create or update lead record in CRM."""
         # Check if exists
-        is_update = lead_id in self.crm_records
+        existing = self.crm_records.get(lead_id)
         
         # Build record
-        record = {
-            "id": lead_id,
-            "type": "lead",
-            "company": data.get("company", ""),
-            "contact": {
+        record = LeadRecord(
+            id=lead_id,
+            company=data.get("company", ""),
+            contact={
                 "name": data.get("contact_name", ""),
                 "email": data.get("contact_email", ""),
                 "phone": data.get("contact_phone", ""),
                 "title": data.get("contact_title", ""),
             },
-            "score": data.get("score", 0),
-            "tier": data.get("lead_tier", "COLD"),
-            "qualification_status": data.get("qualification", {}).get("qualification_status", "PENDING"),
-            "assigned_to": data.get("routing", {}).get("assigned_to", {}),
-            "stage": data.get("stage", "new"),
-            "source": data.get("source", "website"),
-            "industry": data.get("industry", ""),
-            "company_size": data.get("company_size", 0),
-            "deal_value": data.get("deal_size_estimate", 0),
-            "created_at": self.crm_records.get(lead_id, {}).get("created_at", datetime.now().isoformat()),
-            "updated_at": datetime.now().isoformat(),
-            "asloa_processed": True,
-        }
+            score=data.get("score", 0),
+            tier=data.get("lead_tier", "COLD"),
+            qualification_status=qual_status,
+            assigned_to=assigned_to,
+            stage=data.get("stage", "new"),
+            source=data.get("source", "website"),
+            industry=data.get("industry", ""),
+            company_size=data.get("company_size", 0),
+            deal_value=data.get("deal_size_estimate", 0),
+            created_at=existing.created_at if existing else now_iso,
+            updated_at=now_iso,
+        )
         
-        # Store
+        # Store, evicting the least recently synced lead once over the cap
         self.crm_records[lead_id] = record
+        self.crm_records.move_to_end(lead_id)
+        if len(self.crm_records) > _MAX_CRM_RECORDS:
+            self.crm_records.popitem(last=False)
         
         return {
             "record_id": lead_id,
-            "action": "updated" if is_update else "created",
-            "record": record,
+            "action": "updated" if existing else "created",
+            "record": asdict(record),
         }
     
-    def _create_tasks(self, lead_id: str, data: Dict) -> List[Dict[str, Any]]:
+    def _create_tasks(
+        self,
+        lead_id: str,
+        data: Dict,
+        tier: LeadTier,
+        assigned_to: Dict,
+        now: datetime,
+        ids: Iterator[str],
+    ) -> List[Dict[str, Any]]:
         """Create follow-up tasks for assigned rep."""
-        tasks = []
-        routing = data.get("routing", {})
-        assigned_to = routing.get("assigned_to", {})
-        lead_tier = data.get("lead_tier", "COLD")
-        
         if not assigned_to:
-            return tasks
+            return []
         
         # Task 1: Initial outreach
-        if lead_tier == "HOT":
-            due_time = timedelta(minutes=5)
-            priority = "urgent"
-        elif lead_tier == "WARM":
-            due_time = timedelta(hours=2)
-            priority = "high"
-        else:
-            due_time = timedelta(hours=24)
-            priority = "normal"
+        due_time = _TASK_DUE[tier]
+        priority = _TASK_PRIORITY[tier]
         
-        task1 = {
-            "task_id": f"task-{uuid.uuid4().hex[:8]}",
-            "type": "outreach",
-            "title": f"Reach out to {data.get('contact_name', 'lead')} at {data.get('company', 'company')}",
-            "description": f"Lead score: {data.get('score', 0)}. See ASLOA research for personalization.",
-            "assigned_to": assigned_to.get("rep_id", ""),
-            "lead_id": lead_id,
-            "due_at": (datetime.now() + due_time).isoformat(),
-            "priority": priority,
-            "status": "pending",
-        }
-        tasks.append(task1)
-        self.tasks.append(task1)
+        task1 = TaskRecord(
+            task_id=f"task-{next(ids)}",
+            type="outreach",
+            title=f"Reach out to {data.get('contact_name', 'lead')} at {data.get('company', 'company')}",
+            description=f"Lead score: {data.get('score', 0)}. See ASLOA research for personalization.",
+            assigned_to=assigned_to.get("rep_id", ""),
+            lead_id=lead_id,
+            due_at=(now + due_time).isoformat(),
+            priority=priority,
+        )
         
         # Task 2: Follow-up if no response
-        task2 = {
-            "task_id": f"task-{uuid.uuid4().hex[:8]}",
-            "type": "follow_up",
-            "title": f"Follow up with {data.get('contact_name', 'lead')} if no response",
-            "assigned_to": assigned_to.get("rep_id", ""),
-            "lead_id": lead_id,
-            "due_at": (datetime.now() + timedelta(days=3)).isoformat(),
-            "priority": "normal",
-            "status": "pending",
-            "depends_on": task1["task_id"],
-        }
-        tasks.append(task2)
+        task2 = TaskRecord(
+            task_id=f"task-{next(ids)}",
+            type="follow_up",
+            title=f"Follow up with {data.get('contact_name', 'lead')} if no response",
+            assigned_to=assigned_to.get("rep_id", ""),
+            lead_id=lead_id,
+            due_at=(now + timedelta(days=3)).isoformat(),
+            priority="normal",
+            depends_on=task1.task_id,
+        )
+        self.tasks.append(task1)
         self.tasks.append(task2)
         
-        return tasks
+        return [task1.to_dict(), task2.to_dict()]
     
-    def _log_activities(self, lead_id: str, data: Dict) -> List[Dict[str, Any]]:
+    def _log_activities(
+        self, lead_id: str, data: Dict, now_iso: str, ids: Iterator[str]
+    ) -> List[Dict[str, Any]]:
         """Log activities in CRM."""
-        activities = []
-        
-        # Activity: Lead scored
-        if data.get("score"):
-            activity = {
-                "activity_id": f"act-{uuid.uuid4().hex[:8]}",
-                "type": "lead_scored",
-                "lead_id": lead_id,
-                "description": f"ASLOA scored lead at {data.get('score', 0)}/100 ({data.get('lead_tier', 'COLD')})",
-                "automated": True,
-                "timestamp": datetime.now().isoformat(),
-            }
-            activities.append(activity)
-            self.activities.append(activity)
+        activities = [
+            ActivityRecord(
+                activity_id=f"act-{next(ids)}",
+                type=activity_type,
+                lead_id=lead_id,
+                description=describe(data),
+                timestamp=now_iso,
+            )
+            for key, activity_type, describe in _ACTIVITY_SPECS
+            if data.get(key)
+        ]
         
-        # Activity: Lead qualified
-        if data.get("qualification"):
-            qual = data["qualification"]
-            activity = {
-                "activity_id": f"act-{uuid.uuid4().hex[:8]}",
-                "type": "lead_qualified",
-                "lead_id": lead_id,
-                "description": f"BANT qualification: {qual.get('qualification_status', 'UNKNOWN')}",
-                "automated": True,
-                "timestamp": datetime.now().isoformat(),
-            }
-            activities.append(activity)
-            self.activities.append(activity)
-        
-        # Activity: Lead routed
-        if data.get("routing"):
-            routing = data["routing"]
-            activity = {
-                "activity_id": f"act-{uuid.uuid4().hex[:8]}",
-                "type": "lead_routed",
-                "lead_id": lead_id,
-                "description": f"Assigned to {routing.get('assigned_to', {}).get('name', 'rep')}",
-                "automated": True,
-                "timestamp": datetime.now().isoformat(),
-            }
-            activities.append(activity)
-            self.activities.append(activity)
-        
-        # Activity: Outreach sent
-        if data.get("outreach"):
-            activity = {
-                "activity_id": f"act-{uuid.uuid4().hex[:8]}",
-                "type": "email_drafted",
-                "lead_id": lead_id,
-                "description": "ASLOA generated personalized outreach email",
-                "automated": True,
-                "timestamp": datetime.now().isoformat(),
-            }
-            activities.append(activity)
-            self.activities.append(activity)
-        
-        return activities
+        self.activities.extend(activities)
+        return [asdict(a) for a in activities]
     
-    def _send_notifications(self, lead_id: str, data: Dict) -> List[Dict[str, Any]]:
+    def _send_notifications(
+        self,
+        lead_id: str,
+        data: Dict,
+        tier: LeadTier,
+        assigned_to: Dict,
+        now_iso: str,
+        ids: Iterator[str],
+    ) -> List[Dict[str, Any]]:
         """Send notifications to relevant parties."""
         notifications = []
-        routing = data.get("routing", {})
-        assigned_to = routing.get("assigned_to", {})
         lead_tier = data.get("lead_tier", "COLD")
         
         if assigned_to:
             # Notify assigned rep
-            notif = {
-                "notification_id": f"notif-{uuid.uuid4().hex[:8]}",
-                "type": "new_lead_assigned",
-                "recipient": assigned_to.get("email", ""),
-                "title": f"New {lead_tier} Lead Assigned: {data.get('company', 'Company')}",
-                "body": f"Lead Score: {data.get('score', 0)}/100. Contact: {data.get('contact_name', 'N/A')}",
-                "lead_id": lead_id,
-                "priority": "high" if lead_tier == "HOT" else "normal",
-                "sent_at": datetime.now().isoformat(),
-            }
-            notifications.append(notif)
-            self.notifications.append(notif)
+            notifications.append(NotificationRecord(
+                notification_id=f"notif-{next(ids)}",
+                type="new_lead_assigned",
+                recipient=assigned_to.get("email", ""),
+                title=f"New {lead_tier} Lead Assigned: {data.get('company', 'Company')}",
+                body=f"Lead Score: {data.get('score', 0)}/100. Contact: {data.get('contact_name', 'N/A')}",
+                lead_id=lead_id,
+                priority="high" if tier is LeadTier.HOT else "normal",
+                sent_at=now_iso,
+            ))
             
             # Notify manager for hot leads
-            if lead_tier == "HOT" and data.get("deal_size_estimate", 0) > 50000:
-                notif_mgr = {
-                    "notification_id": f"notif-{uuid.uuid4().hex[:8]}",
-                    "type": "hot_lead_alert",
-                    "recipient": "sales-manager@company.com",
-                    "title": f"HOT Lead Alert: {data.get('company', 'Company')} (${data.get('deal_size_estimate', 0):,})",
-                    "body": f"High-value lead assigned to {assigned_to.get('name', 'rep')}",
-                    "lead_id": lead_id,
-                    "priority": "urgent",
-                    "sent_at": datetime.now().isoformat(),
-                }
-                notifications.append(notif_mgr)
-                self.notifications.append(notif_mgr)
+            if tier is LeadTier.HOT and data.get("deal_size_estimate", 0) > 50000:
+                notifications.append(NotificationRecord(
+                    notification_id=f"notif-{next(ids)}",
+                    type="hot_lead_alert",
+                    recipient="sales-manager@company.com",
+                    title=f"HOT Lead Alert: {data.get('company', 'Company')} ({_FMT_USD_EXACT(data.get('deal_size_estimate', 0))})",
+                    body=f"High-value lead assigned to {assigned_to.get('name', 'rep')}",
+                    lead_id=lead_id,
+                    priority="urgent",
+                    sent_at=now_iso,
+                ))
         
-        return notifications
+        self.notifications.extend(notifications)
+        return [asdict(n) for n in notifications]
     
-    def _update_pipeline(self, lead_id: str, data: Dict) -> Dict[str, Any]:
+    def _update_pipeline(
+        self, lead_id: str, data: Dict, qual_status: str, now_iso: str
+    ) -> Dict[str, Any]:
         """Update pipeline stage and metrics."""
-        qualification = data.get("qualification", {})
-        qual_status = qualification.get("qualification_status", "PENDING")
-        
         # Determine stage
         if qual_status == "QUALIFIED":
             stage = "qualified"
@@ -310,5 +398,5 @@ class CRMSyncAgent(BaseAgent):
             "probability": probability,
             "deal_value": data.get("deal_size_estimate", 0),
             "weighted_value": data.get("deal_size_estimate", 0) * probability,
-            "updated_at": datetime.now().isoformat(),
+            "updated_at": now_iso,
         }
@@ -10,12 +10,212 @@ Scoring Criteria:
 - Historical conversion patterns
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import uuid
+from typing import Dict, Any, Optional, List, Tuple
+from bisect import bisect_right
+from types import MappingProxyType
+import math
+import os
+import re
 import random
 
+import numpy as np
+
 from app.agents.base_agent import BaseAgent
+from app.asloa.agents._kernels import tally_engagement
+from app.asloa.clock import NOW
+from app.asloa.text import first_band_pattern, lower_intern
+
+
+# ICP (Ideal Customer Profile) weights
+_ICP_WEIGHTS = MappingProxyType({
+    "company_size": 20,      # 0-20 points
+    "industry_fit": 20,      # 0-20 points
+    "authority_level": 20,   # 0-20 points
+    "engagement": 20,        # 0-20 points
+    "budget_signals": 20,    # 0-20 points
+})
+
+# Ideal company sizes by revenue tier
+_IDEAL_COMPANY_SIZES = MappingProxyType({
+    "enterprise": {"min": 1000, "max": float("inf"), "score": 20},
+    "mid_market": {"min": 100, "max": 999, "score": 18},
+    "smb": {"min": 20, "max": 99, "score": 12},
+    "startup": {"min": 1, "max": 19, "score": 8},
+})
+
+# Company-size score ladder: scores[i] applies from breaks[i-1] up to breaks[i]
+_SIZE_BREAKS = (1, 20, 100, 1000)
+_SIZE_SCORES = (5, 8, 12, 18, 20)  # 5 = unknown size
+_SIZE_SCORES_ARR = np.array(_SIZE_SCORES, dtype=np.int64)
+
+# Revenue score ladder; the first break is the smallest positive float so
+# that any revenue > 0 lands in the 3-point bucket
+_REVENUE_BREAKS = (math.nextafter(0.0, 1.0), 100_000, 1_000_000, 10_000_000)
+_REVENUE_SCORES = (0, 3, 5, 8, 10)
+_REVENUE_SCORES_ARR = np.array(_REVENUE_SCORES, dtype=np.int64)
+
+# Target industries
+_TARGET_INDUSTRIES = MappingProxyType({
+    "technology": 20,
+    "saas": 20,
+    "fintech": 18,
+    "healthcare": 16,
+    "manufacturing": 15,
+    "retail": 14,
+    "ecommerce": 14,
+    "logistics": 13,
+    "education": 12,
+    "other": 8,
+})
+_DEFAULT_INDUSTRY_SCORE = 8
+
+# Keywords recognised inside free-form industry labels ("SaaS / B2B",
+# "Enterprise Software"); the group name is the canonical industry
+_INDUSTRY_KEYWORDS = (
+    ("saas", ("saas",)),
+    ("fintech", ("fintech", "finance", "financial services")),
+    ("technology", ("technology", "tech", "software")),
+    ("healthcare", ("healthcare", "health care", "health")),
+    ("manufacturing", ("manufacturing",)),
+    ("ecommerce", ("ecommerce", "e-commerce")),
+    ("retail", ("retail",)),
+    ("logistics", ("logistics",)),
+    ("education", ("education", "edtech")),
+)
+_INDUSTRY_RE = re.compile(
+    "|".join(
+        rf"(?P<{industry}>\b(?:{'|'.join(map(re.escape, words))})\b)"
+        for industry, words in _INDUSTRY_KEYWORDS
+    )
+)
+
+
+def _canonical_industry(label: str) -> str:
+    """Map an industry label to a target-industry key when one is recognisable."""
+    key = lower_intern(label)
+    if key in _TARGET_INDUSTRIES:
+        return key
+    match = _INDUSTRY_RE.search(key)
+    return match.lastgroup if match else key
+
+
+# Industry codes index a score table for batch scoring; unknown
+# industries get an extra trailing slot with the default score
+_INDUSTRY_CODES = {k: i for i, k in enumerate(_TARGET_INDUSTRIES)}
+_INDUSTRY_OTHER = len(_INDUSTRY_CODES)
+_INDUSTRY_SCORES = np.array(
+    list(_TARGET_INDUSTRIES.values()) + [_DEFAULT_INDUSTRY_SCORE], dtype=np.int64
+)
+
+# Authority levels
+_AUTHORITY_LEVELS = MappingProxyType({
+    "c_level": 20,        # CEO, CTO, CFO, etc.
+    "vp": 18,             # VP of Sales, VP Engineering
+    "director": 16,       # Director level
+    "manager": 12,        # Manager level
+    "individual": 6,      # IC
+    "unknown": 4,
+})
+
+# Reasoning rules in display order: strengths first, then weaknesses.
+# Each predicate takes (company, industry, authority, engagement, budget).
+_REASON_RULES = (
+    (lambda c, i, a, e, b: a >= 16, "{contact} ({title}) is a decision-maker"),
+    (lambda c, i, a, e, b: c >= 18, "{company} is in our ideal company size range"),
+    (lambda c, i, a, e, b: i >= 16, "Industry is a strong fit for our solution"),
+    (lambda c, i, a, e, b: e >= 12, "Shows high engagement signals"),
+    (lambda c, i, a, e, b: b >= 12, "Budget indicators are positive"),
+    (lambda c, i, a, e, b: a < 10, "Contact may not be a decision-maker"),
+    (lambda c, i, a, e, b: c < 10, "Company size is below ideal range"),
+    (lambda c, i, a, e, b: e < 8, "Limited engagement activity"),
+)
+
+# Inputs that feed a component score; a lead with none of them set gets
+# the fixed baseline scores
+_SCORING_FIELDS = (
+    "company_size",
+    "industry",
+    "contact_title",
+    "source",
+    "engagement_signals",
+    "budget_mentioned",
+    "annual_revenue",
+    "funding_raised",
+)
+
+# Title keywords per authority band, highest band first
+_AUTHORITY_KEYWORDS = (
+    ("c", ("ceo", "cto", "cfo", "coo", "chief", "founder", "owner")),
+    ("v", ("vp", "vice president", "head of")),
+    ("d", ("director",)),
+    ("m", ("manager",)),
+    ("s", ("lead", "senior")),
+)
+_AUTHORITY_SCORES = {"c": 20, "v": 18, "d": 16, "m": 12, "s": 10}
+
+# Engagement points by lead source (unlisted sources score 2)
+_SOURCE_SCORES = {
+    "referral": 8, "partner": 8,
+    "demo_request": 7, "contact_form": 7,
+    "linkedin": 5,
+    "website": 4,
+    "ad": 3, "paid": 3,
+}
+_DEFAULT_SOURCE_SCORE = 2
+
+# Engagement signals as bits, and the points each bit is worth
+_SIGNAL_BITS = {
+    "pricing_page_visit": 1,
+    "demo_watched": 2,
+    "case_study_download": 4,
+    "email_opened": 8,
+    "email_clicked": 16,
+}
+_SIGNAL_POINTS = {1: 4, 2: 4, 4: 3, 8: 2, 16: 3}
+
+# Total signal points for every 5-bit mask, so scoring is one table lookup
+_SIGNAL_WEIGHTS = tuple(
+    sum(points for bit, points in _SIGNAL_POINTS.items() if mask & bit)
+    for mask in range(32)
+)
+_SIGNAL_WEIGHTS_ARR = np.array(_SIGNAL_WEIGHTS, dtype=np.int64)
+
+
+def _signal_mask(signals: List[str]) -> int:
+    """Encode a lead's engagement signals as a bitmask."""
+    mask = 0
+    for signal in signals:
+        mask |= _SIGNAL_BITS.get(signal, 0)
+    return mask
+
+
+def _has_odd_field(lead: Dict[str, Any]) -> bool:
+    """
+    True if a field batch scoring reads has an unexpected type (e.g. None):
+    a non-numeric size or revenue, a non-string industry, title or source,
+    or non-list engagement signals.
+    """
+    return not (
+        isinstance(lead.get("company_size", 0), (int, float))
+        and isinstance(lead.get("annual_revenue", 0), (int, float))
+        and isinstance(lead.get("industry", "other"), str)
+        and isinstance(lead.get("contact_title", ""), str)
+        and isinstance(lead.get("source", ""), str)
+        and isinstance(lead.get("engagement_signals", []), (list, tuple))
+    )
+
+
+# Total-score cutoffs and the (tier, priority, recommendation) per band
+_TIER_CUTOFFS = (40, 60, 80)
+_TIER_BANDS = (
+    ("UNQUALIFIED", "low", "Likely not a fit, consider deprioritizing"),
+    ("COLD", "normal", "Qualify further before outreach"),
+    ("WARM", "high", "Add to nurture sequence"),
+    ("HOT", "immediate", "Prioritize for immediate outreach"),
+)
+
+# One anchored pass over the title; highest band with a keyword wins
+_AUTHORITY_RE = first_band_pattern(_AUTHORITY_KEYWORDS)
 
 
 class LeadScoringAgent(BaseAgent):
@@ -31,46 +231,14 @@ class LeadScoringAgent(BaseAgent):
     def __init__(self):
         super().__init__("lead_scoring")
         
-        # ICP (Ideal Customer Profile) weights
-        self.icp_weights = {
-            "company_size": 20,      # 0-20 points
-            "industry_fit": 20,      # 0-20 points
-            "authority_level": 20,   # 0-20 points
-            "engagement": 20,        # 0-20 points
-            "budget_signals": 20,    # 0-20 points
-        }
-        
-        # Ideal company sizes by revenue tier
-        self.ideal_company_sizes = {
-            "enterprise": {"min": 1000, "max": float("inf"), "score": 20},
-            "mid_market": {"min": 100, "max": 999, "score": 18},
-            "smb": {"min": 20, "max": 99, "score": 12},
-            "startup": {"min": 1, "max": 19, "score": 8},
-        }
-        
-        # Target industries
-        self.target_industries = {
-            "technology": 20,
-            "saas": 20,
-            "fintech": 18,
-            "healthcare": 16,
-            "manufacturing": 15,
-            "retail": 14,
-            "ecommerce": 14,
-            "logistics": 13,
-            "education": 12,
-            "other": 8,
-        }
+        # Shared read-only scoring tables (module constants)
+        self.icp_weights = _ICP_WEIGHTS
+        self.ideal_company_sizes = _IDEAL_COMPANY_SIZES
+        self.target_industries = _TARGET_INDUSTRIES
+        self.authority_levels = _AUTHORITY_LEVELS
         
-        # Authority levels
-        self.authority_levels = {
-            "c_level": 20,        # CEO, CTO, CFO, etc.
-            "vp": 18,             # VP of Sales, VP Engineering
-            "director": 16,       # Director level
-            "manager": 12,        # Manager level
-            "individual": 6,      # IC
-            "unknown": 4,
-        }
+        # Component scores of a lead with no scoring inputs (always UNQUALIFIED)
+        self._baseline_scores = self._score_components({})
     
     def process(
         self, 
@@ -96,62 +264,7 @@ class LeadScoringAgent(BaseAgent):
         start_time = self._start_processing()
         
         try:
-            lead_id = input_data.get("lead_id", f"lead-{uuid.uuid4().hex[:8]}")
-            
-            # Calculate component scores
-            company_score = self._score_company_size(input_data)
-            industry_score = self._score_industry(input_data)
-            authority_score = self._score_authority(input_data)
-            engagement_score = self._score_engagement(input_data)
-            budget_score = self._score_budget_signals(input_data)
-            
-            # Total score
-            total_score = (
-                company_score + 
-                industry_score + 
-                authority_score + 
-                engagement_score + 
-                budget_score
-            )
-            
-            # Determine lead tier
-            if total_score >= 80:
-                tier = "HOT"
-                priority = "immediate"
-                recommendation = "Prioritize for immediate outreach"
-            elif total_score >= 60:
-                tier = "WARM"
-                priority = "high"
-                recommendation = "Add to nurture sequence"
-            elif total_score >= 40:
-                tier = "COLD"
-                priority = "normal"
-                recommendation = "Qualify further before outreach"
-            else:
-                tier = "UNQUALIFIED"
-                priority = "low"
-                recommendation = "Likely not a fit, consider deprioritizing"
-            
-            result = {
-                "lead_id": lead_id,
-                "score": total_score,
-                "tier": tier,
-                "priority": priority,
-                "recommendation": recommendation,
-                "breakdown": {
-                    "company_size_score": company_score,
-                    "industry_score": industry_score,
-                    "authority_score": authority_score,
-                    "engagement_score": engagement_score,
-                    "budget_signals_score": budget_score,
-                },
-                "reasoning": self._generate_reasoning(
-                    input_data, total_score, tier,
-                    company_score, industry_score, authority_score,
-                    engagement_score, budget_score
-                ),
-                "scored_at": datetime.now().isoformat(),
-            }
+            result = self._score_lead(input_data, NOW.get())
             
             self._complete_processing(start_time, success=True)
             self._last_output = result
@@ -166,76 +279,176 @@ class LeadScoringAgent(BaseAgent):
             self._complete_processing(start_time, success=False)
             return {"status": "error", "error": str(e)}
     
-    def _score_company_size(self, lead: Dict) -> int:
-        """Score based on company size/employees."""
-        size = lead.get("company_size", 0)
+    def process_batch(self, leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Score many leads at once (e.g. a CRM import).
+        
+        Same per-lead output as process(). Numeric components and tiers
+        are computed over column arrays; only the title and engagement
+        string matching stays per lead.
+        
+        Leads with a field of an unexpected type (e.g. a null company
+        size or industry) are scored one at a time exactly as process()
+        would, so a lead process() rejects gets an empty result and its
+        error under "errors" instead of a made-up score.
+        """
+        start_time = self._start_processing()
         
-        if size >= 1000:
-            return 20
-        elif size >= 100:
-            return 18
-        elif size >= 20:
-            return 12
-        elif size >= 1:
-            return 8
+        try:
+            scored_at = NOW.get()
+            results, errors = self._map_batch(
+                leads,
+                lambda batch: self._score_columns(batch, scored_at),
+                lambda lead: self._score_lead(lead, scored_at),
+                _has_odd_field,
+                "Lead scoring failed",
+            )
+            
+            self._complete_processing(start_time, success=True)
+            if results:
+                self._last_output = results[-1]
+            
+            return {
+                "status": "success",
+                "scoring": results,
+                "errors": errors,
+            }
+            
+        except Exception as e:
+            self._log_error(e, "Batch lead scoring failed")
+            self._complete_processing(start_time, success=False)
+            return {"status": "error", "error": str(e)}
+    
+    def _score_lead(self, input_data: Dict[str, Any], scored_at: str) -> Dict[str, Any]:
+        """Score one lead."""
+        lead_id = input_data.get("lead_id", f"lead-{os.urandom(4).hex()}")
+        
+        # Calculate component scores; blank leads skip straight to the baseline
+        if any(input_data.get(field) for field in _SCORING_FIELDS):
+            scores = self._score_components(input_data)
         else:
-            return 5  # Unknown size
+            scores = self._baseline_scores
+        company_score, industry_score, authority_score, engagement_score, budget_score = scores
+        
+        # Total score
+        total_score = (
+            company_score + 
+            industry_score + 
+            authority_score + 
+            engagement_score + 
+            budget_score
+        )
+        
+        # Determine lead tier
+        band = bisect_right(_TIER_CUTOFFS, total_score)
+        
+        return self._build_result(
+            lead_id, input_data, band,
+            company_score, industry_score, authority_score,
+            engagement_score, budget_score, scored_at,
+        )
+    
+    def _score_columns(self, leads: List[Dict[str, Any]], scored_at: str) -> List[Dict[str, Any]]:
+        """Score leads over column arrays; every company size and revenue is a number."""
+        n = len(leads)
+        sizes = np.fromiter((d.get("company_size", 0) for d in leads), dtype=np.float64, count=n)
+        revenue = np.fromiter((d.get("annual_revenue", 0) for d in leads), dtype=np.float64, count=n)
+        budget_mentioned = np.fromiter((bool(d.get("budget_mentioned")) for d in leads), dtype=bool, count=n)
+        funded = np.fromiter((bool(d.get("funding_raised")) for d in leads), dtype=bool, count=n)
+        industry_idx = np.fromiter(
+            (_INDUSTRY_CODES.get(_canonical_industry(d.get("industry", "other")), _INDUSTRY_OTHER)
+             for d in leads),
+            dtype=np.intp, count=n,
+        )
+        
+        company = _SIZE_SCORES_ARR[np.searchsorted(_SIZE_BREAKS, sizes, side="right")]
+        industry = _INDUSTRY_SCORES[industry_idx]
+        authority = np.fromiter((self._score_authority(d) for d in leads), dtype=np.int64, count=n)
+        source_scores = np.fromiter(
+            (_SOURCE_SCORES.get(lower_intern(d.get("source", "")), _DEFAULT_SOURCE_SCORE) for d in leads),
+            dtype=np.int64, count=n,
+        )
+        signal_masks = np.fromiter(
+            (_signal_mask(d.get("engagement_signals", [])) for d in leads), dtype=np.uint8, count=n
+        )
+        engagement = tally_engagement(signal_masks, source_scores, _SIGNAL_WEIGHTS_ARR)
+        revenue_score = _REVENUE_SCORES_ARR[np.searchsorted(_REVENUE_BREAKS, revenue, side="right")]
+        budget = np.minimum(budget_mentioned * 10 + revenue_score + funded * 5, 20)
+        
+        components = np.stack([company, industry, authority, engagement, budget])
+        totals = components.sum(axis=0)
+        bands = np.digitize(totals, _TIER_CUTOFFS)
+        
+        # Back to Python ints so results match process() exactly
+        company, industry, authority, engagement, budget = components.tolist()
+        bands = bands.tolist()
+        
+        return [
+            self._build_result(
+                lead.get("lead_id", f"lead-{os.urandom(4).hex()}"), lead, bands[i],
+                company[i], industry[i], authority[i], engagement[i], budget[i], scored_at,
+            )
+            for i, lead in enumerate(leads)
+        ]
+    
+    def _score_components(self, lead: Dict) -> Tuple[int, int, int, int, int]:
+        """Company, industry, authority, engagement and budget scores."""
+        return (
+            self._score_company_size(lead),
+            self._score_industry(lead),
+            self._score_authority(lead),
+            self._score_engagement(lead),
+            self._score_budget_signals(lead),
+        )
+    
+    def _build_result(
+        self, lead_id: str, lead: Dict, band: int,
+        company: int, industry: int, authority: int,
+        engagement: int, budget: int, scored_at: str
+    ) -> Dict[str, Any]:
+        """Assemble the scoring result for one lead."""
+        total = company + industry + authority + engagement + budget
+        tier, priority, recommendation = _TIER_BANDS[band]
+        return {
+            "lead_id": lead_id,
+            "score": total,
+            "tier": tier,
+            "priority": priority,
+            "recommendation": recommendation,
+            "breakdown": {
+                "company_size_score": company,
+                "industry_score": industry,
+                "authority_score": authority,
+                "engagement_score": engagement,
+                "budget_signals_score": budget,
+            },
+            "reasoning": self._generate_reasoning(
+                lead, total, tier,
+                company, industry, authority,
+                engagement, budget
+            ),
+            "scored_at": scored_at,
+        }
+    
+    def _score_company_size(self, lead: Dict) -> int:
+        """Score based on company size/employees."""
+        return _SIZE_SCORES[bisect_right(_SIZE_BREAKS, lead.get("company_size", 0))]
     
     def _score_industry(self, lead: Dict) -> int:
         """Score based on industry fit."""
-        industry = lead.get("industry", "other").lower()
-        return self.target_industries.get(industry, 8)
+        industry = _canonical_industry(lead.get("industry", "other"))
+        return _TARGET_INDUSTRIES.get(industry, _DEFAULT_INDUSTRY_SCORE)
     
     def _score_authority(self, lead: Dict) -> int:
         """Score based on contact's authority level."""
-        title = lead.get("contact_title", "").lower()
-        
-        if any(x in title for x in ["ceo", "cto", "cfo", "coo", "chief", "founder", "owner"]):
-            return 20
-        elif any(x in title for x in ["vp", "vice president", "head of"]):
-            return 18
-        elif "director" in title:
-            return 16
-        elif "manager" in title:
-            return 12
-        elif any(x in title for x in ["lead", "senior"]):
-            return 10
-        else:
-            return 6
+        match = _AUTHORITY_RE.match(lead.get("contact_title", "").lower())
+        return _AUTHORITY_SCORES[match.lastgroup] if match else 6
     
     def _score_engagement(self, lead: Dict) -> int:
         """Score based on engagement signals."""
-        signals = lead.get("engagement_signals", [])
-        source = lead.get("source", "").lower()
-        
-        score = 0
-        
-        # Source scoring
-        if source in ["referral", "partner"]:
-            score += 8
-        elif source in ["demo_request", "contact_form"]:
-            score += 7
-        elif source == "linkedin":
-            score += 5
-        elif source == "website":
-            score += 4
-        elif source in ["ad", "paid"]:
-            score += 3
-        else:
-            score += 2
-        
-        # Engagement signals
-        if "pricing_page_visit" in signals:
-            score += 4
-        if "demo_watched" in signals:
-            score += 4
-        if "case_study_download" in signals:
-            score += 3
-        if "email_opened" in signals:
-            score += 2
-        if "email_clicked" in signals:
-            score += 3
-        
+        source = lower_intern(lead.get("source", ""))
+        score = _SOURCE_SCORES.get(source, _DEFAULT_SOURCE_SCORE)
+        score += _SIGNAL_WEIGHTS[_signal_mask(lead.get("engagement_signals", []))]
         return min(score, 20)
     
     def _score_budget_signals(self, lead: Dict) -> int:
@@ -245,15 +458,7 @@ class LeadScoringAgent(BaseAgent):
         if lead.get("budget_mentioned"):
             score += 10
         
-        revenue = lead.get("annual_revenue", 0)
-        if revenue >= 10_000_000:
-            score += 10
-        elif revenue >= 1_000_000:
-            score += 8
-        elif revenue >= 100_000:
-            score += 5
-        elif revenue > 0:
-            score += 3
+        score += _REVENUE_SCORES[bisect_right(_REVENUE_BREAKS, lead.get("annual_revenue", 0))]
         
         if lead.get("funding_raised"):
             score += 5
@@ -266,34 +471,21 @@ class LeadScoringAgent(BaseAgent):
         engagement: int, budget: int
     ) -> str:
         """Generate human-readable scoring reasoning."""
-        company_name = lead.get("company", "the company")
-        contact = lead.get("contact_name", "the contact")
-        title = lead.get("contact_title", "")
-        
-        reasons = []
-        
-        # Highlight strengths
-        if authority >= 16:
-            reasons.append(f"{contact} ({title}) is a decision-maker")
-        if company >= 18:
-            reasons.append(f"{company_name} is in our ideal company size range")
-        if industry >= 16:
-            reasons.append(f"Industry is a strong fit for our solution")
-        if engagement >= 12:
-            reasons.append(f"Shows high engagement signals")
-        if budget >= 12:
-            reasons.append(f"Budget indicators are positive")
-        
-        # Highlight weaknesses
-        if authority < 10:
-            reasons.append(f"Contact may not be a decision-maker")
-        if company < 10:
-            reasons.append(f"Company size is below ideal range")
-        if engagement < 8:
-            reasons.append(f"Limited engagement activity")
+        # Pick the first three matching rules, then format only those
+        chosen = []
+        for applies, template in _REASON_RULES:
+            if applies(company, industry, authority, engagement, budget):
+                chosen.append(template)
+                if len(chosen) == 3:
+                    break
         
         reasoning = f"Lead scored {total}/100 ({tier}). "
-        if reasons:
-            reasoning += " | ".join(reasons[:3])
+        if chosen:
+            fields = {
+                "company": lead.get("company", "the company"),
+                "contact": lead.get("contact_name", "the contact"),
+                "title": lead.get("contact_title", ""),
+            }
+            reasoning += " | ".join(template.format_map(fields) for template in chosen)
         
         return reasoning
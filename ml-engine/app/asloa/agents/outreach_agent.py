@@ -10,33 +10,105 @@ Capabilities:
 - A/B variant generation
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import uuid
+from typing import Dict, Any, Optional, List, Tuple
+from string import Formatter
+from types import MappingProxyType
+import os
 import random
 
 from app.agents.base_agent import BaseAgent
+from app.asloa.clock import NOW
+from app.asloa.text import lower_intern
+from app.asloa.tiers import LeadTier
 
 
-class OutreachAgent(BaseAgent):
-    """
-    Outreach Agent - Generates personalized sales emails.
-    
-    Creates context-aware, personalized outreach based on:
-    - Prospect's industry and company size
-    - Contact's role and seniority
-    - Identified pain points
-    - Buying triggers
-    """
-    
-    def __init__(self):
-        super().__init__("outreach")
-        
-        # Email templates by scenario
-        self.templates = {
-            "hot_lead": {
-                "subject": "Quick question about {pain_point} at {company}",
-                "body": """Hi {first_name},
+# Pre-parsed template: (literal_text, field, format_spec) segments. The
+# field is a name until _bind() turns it into an index into the per-email
+# values tuple.
+_Parts = Tuple[Tuple[str, Any, str], ...]
+
+# Per-email values, in the order process() packs them; the industry
+# fields come last and are only packed when no specialization exists
+_EMAIL_FIELDS = (
+    "first_name",
+    "company",
+    "pain_point",
+    "trigger_context",
+    "personalization_hook",
+    "result",
+    "value_prop",
+    "original_subject",
+    "industry",
+    "reference_company",
+)
+_FIELD_INDEX = {name: i for i, name in enumerate(_EMAIL_FIELDS)}
+
+
+def _compile_template(template: str) -> _Parts:
+    """Parse a str.format template once into literal/field segments."""
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if conversion:
+            raise ValueError(f"Unsupported conversion !{conversion} in outreach template")
+        parts.append((literal, field, spec or ""))
+    return tuple(parts)
+
+
+def _render(parts: _Parts, data) -> str:
+    """Render template segments against a mapping (named) or tuple (bound)."""
+    return "".join([
+        literal if field is None else literal + format(data[field], spec)
+        for literal, field, spec in parts
+    ])
+
+
+def _specialize(parts: _Parts, values: Dict[str, Any]) -> _Parts:
+    """Bake known field values into the literal text, leaving other fields open."""
+    out = []
+    pending = ""
+    for literal, field, spec in parts:
+        pending += literal
+        if field is None:
+            continue
+        if field in values:
+            pending += format(values[field], spec)
+        else:
+            out.append((pending, field, spec))
+            pending = ""
+    if pending:
+        out.append((pending, None, ""))
+    return tuple(out)
+
+
+def _bind(parts: _Parts) -> _Parts:
+    """Resolve remaining field names to positions in _EMAIL_FIELDS."""
+    return tuple(
+        (literal, None if field is None else _FIELD_INDEX[field], spec)
+        for literal, field, spec in parts
+    )
+
+
+def _industry_fields(industry: str) -> Dict[str, str]:
+    """Template fields that depend only on the lead's industry."""
+    return {
+        "industry": industry,
+        "reference_company": f"similar {industry} companies",
+    }
+
+
+# Fields with the same value in every email
+_STATIC_FIELDS = MappingProxyType({
+    "timeframe": "90 days",
+    "sender_name": "ASLOA Sales Team",
+    "follow_up_hook": "I wanted to make sure this didn't get buried in your inbox.",
+})
+
+
+# Email templates by scenario
+_TEMPLATES = MappingProxyType({
+    "hot_lead": {
+        "subject": "Quick question about {pain_point} at {company}",
+        "body": """Hi {first_name},
 
 {personalization_hook}
 
@@ -48,10 +120,10 @@ Would you be open to a 15-minute call this week to explore if we could help {com
 
 Best,
 {sender_name}""",
-            },
-            "warm_lead": {
-                "subject": "Idea for {company}'s {pain_point} challenge",
-                "body": """Hi {first_name},
+    },
+    "warm_lead": {
+        "subject": "Idea for {company}'s {pain_point} challenge",
+        "body": """Hi {first_name},
 
 {personalization_hook}
 
@@ -63,10 +135,10 @@ I'd love to share a few quick insights. Would you be open to a brief conversatio
 
 Best,
 {sender_name}""",
-            },
-            "cold_lead": {
-                "subject": "{first_name}, quick question",
-                "body": """Hi {first_name},
+    },
+    "cold_lead": {
+        "subject": "{first_name}, quick question",
+        "body": """Hi {first_name},
 
 I'm reaching out because we help {industry} companies like {company} with {pain_point}.
 
@@ -78,10 +150,10 @@ Would a quick 10-minute call work for you?
 
 Best,
 {sender_name}""",
-            },
-            "follow_up": {
-                "subject": "Re: {original_subject}",
-                "body": """Hi {first_name},
+    },
+    "follow_up": {
+        "subject": "Re: {original_subject}",
+        "body": """Hi {first_name},
 
 Just following up on my previous note. I know you're busy, so I'll keep this brief.
 
@@ -91,17 +163,93 @@ If now isn't the right time, no worries at all. But if {pain_point} is on your r
 
 Best,
 {sender_name}""",
-            },
-        }
+    },
+})
+
+# Parse each template once with the static fields already filled in;
+# process() only substitutes the per-lead values
+_GENERIC = {
+    key: (
+        _specialize(_compile_template(tpl["subject"]), _STATIC_FIELDS),
+        _specialize(_compile_template(tpl["body"]), _STATIC_FIELDS),
+    )
+    for key, tpl in _TEMPLATES.items()
+}
+_COMPILED = MappingProxyType({
+    key: (_bind(subject_parts), _bind(body_parts))
+    for key, (subject_parts, body_parts) in _GENERIC.items()
+})
+
+# Result templates by industry
+_RESULTS = MappingProxyType({
+    "technology": ["40% faster deployment", "3x developer productivity", "50% reduction in incidents"],
+    "saas": ["25% reduction in churn", "2x user activation", "40% more expansion revenue"],
+    "manufacturing": ["30% less downtime", "25% productivity increase", "15% cost reduction"],
+    "retail": ["20% inventory efficiency", "35% faster fulfillment", "15% labor cost savings"],
+    "healthcare": ["40% shorter wait times", "25% better staff utilization", "30% compliance improvement"],
+})
+
+# Template and send recommendation per tier, indexed by LeadTier
+_TEMPLATE_BY_TIER = ("cold_lead", "warm_lead", "hot_lead")
+_SEND_RECOMMENDATIONS = (
+    MappingProxyType({
+        "urgency": "within_week",
+        "best_time": "Tuesday 10 AM or Wednesday 2 PM",
+        "reason": "Cold outreach - timing matters for open rates",
+    }),
+    MappingProxyType({
+        "urgency": "within_24h",
+        "best_time": "Tuesday-Thursday, 9-11 AM",
+        "reason": "Warm lead - personalized outreach yields best results",
+    }),
+    MappingProxyType({
+        "urgency": "immediate",
+        "best_time": "ASAP",
+        "reason": "Hot lead - respond within 5 minutes for best conversion",
+    }),
+)
+
+# A/B variant subject lines
+_VARIANT_SUBJECTS = (
+    "{first_name} - thought you'd find this interesting",
+    "Idea for {company}",
+    "{first_name}, are you thinking about this?",
+    "Can I share a quick insight, {first_name}?",
+)
+
+# Templates further specialized for each industry with curated results;
+# other industries fall back to _COMPILED
+_SPECIALIZED = MappingProxyType({
+    (key, industry): (
+        _bind(_specialize(subject_parts, _industry_fields(industry))),
+        _bind(_specialize(body_parts, _industry_fields(industry))),
+    )
+    for key, (subject_parts, body_parts) in _GENERIC.items()
+    for industry in _RESULTS
+})
+
+
+class OutreachAgent(BaseAgent):
+    """
+    Outreach Agent - Generates personalized sales emails.
+    
+    Creates context-aware, personalized outreach based on:
+    - Prospect's industry and company size
+    - Contact's role and seniority
+    - Identified pain points
+    - Buying triggers
+    """
+    
+    def __init__(self):
+        super().__init__("outreach")
+        
+        # Shared read-only template and result tables (module constants)
+        self.templates = _TEMPLATES
+        self.results = _RESULTS
         
-        # Result templates by industry
-        self.results = {
-            "technology": ["40% faster deployment", "3x developer productivity", "50% reduction in incidents"],
-            "saas": ["25% reduction in churn", "2x user activation", "40% more expansion revenue"],
-            "manufacturing": ["30% less downtime", "25% productivity increase", "15% cost reduction"],
-            "retail": ["20% inventory efficiency", "35% faster fulfillment", "15% labor cost savings"],
-            "healthcare": ["40% shorter wait times", "25% better staff utilization", "30% compliance improvement"],
-        }
+        # Private RNG for result and A/B subject picks; avoids contending
+        # on the module-level generator shared with the rest of the app
+        self._rng = random.Random()
     
     def process(
         self,
@@ -122,22 +270,23 @@ Best,
         - triggers: List of trigger events
         - personalization_hooks: Hooks from research
         - is_follow_up: Whether this is a follow-up
+        - generate_variant: Whether to build an A/B variant (default True)
         """
         start_time = self._start_processing()
         
         try:
-            lead_id = input_data.get("lead_id", f"lead-{uuid.uuid4().hex[:8]}")
+            lead_id = input_data.get("lead_id", f"lead-{os.urandom(4).hex()}")
             
             # Determine template to use
-            template_key = self._select_template(input_data)
-            template = self.templates[template_key]
+            tier = LeadTier.from_string(input_data.get("lead_tier", "COLD").upper())
+            template_key = self._select_template(input_data, tier)
             
             # Get first name
             full_name = input_data.get("contact_name", "there")
             first_name = full_name.split()[0] if full_name else "there"
             
             # Prepare personalization data
-            industry = input_data.get("industry", "technology").lower()
+            industry = lower_intern(input_data.get("industry", "technology"))
             pain_points = input_data.get("pain_points", [])
             triggers = input_data.get("triggers", [])
             hooks = input_data.get("personalization_hooks", [])
@@ -149,32 +298,39 @@ Best,
             
             # Get result for industry
             results = self.results.get(industry, self.results["technology"])
-            result = random.choice(results)
+            result = self._rng.choice(results)
             
-            # Fill template
-            email_data = {
-                "first_name": first_name,
-                "company": input_data.get("company", "your company"),
-                "industry": industry,
-                "pain_point": pain_point,
-                "trigger_context": trigger_context,
-                "personalization_hook": personalization_hook,
-                "result": result,
-                "timeframe": "90 days",
-                "reference_company": f"similar {industry} companies",
-                "value_prop": f"improve {pain_point}",
-                "sender_name": "ASLOA Sales Team",
-                "follow_up_hook": "I wanted to make sure this didn't get buried in your inbox.",
-                "original_subject": f"Quick question about {pain_point}",
-            }
+            # Fill template; values are packed in _EMAIL_FIELDS order and
+            # static/industry fields are pre-rendered where possible
+            email_data = (
+                first_name,
+                input_data.get("company", "your company"),
+                pain_point,
+                trigger_context,
+                personalization_hook,
+                result,
+                f"improve {pain_point}",
+                f"Quick question about {pain_point}",
+            )
+            specialized = _SPECIALIZED.get((template_key, industry))
+            if specialized is None:
+                fields = _industry_fields(industry)
+                email_data += (fields["industry"], fields["reference_company"])
+                specialized = _COMPILED[template_key]
+            subject_parts, body_parts = specialized
             
-            subject = template["subject"].format(**email_data)
-            body = template["body"].format(**email_data)
+            subject = _render(subject_parts, email_data)
+            body = _render(body_parts, email_data)
             
-            # Generate A/B variant
-            variant_subject = self._generate_variant_subject(
-                subject, first_name, input_data.get("company", "")
-            )
+            # Generate A/B variant unless the caller opted out
+            variant = None
+            if input_data.get("generate_variant", True):
+                variant = {
+                    "subject": self._generate_variant_subject(
+                        subject, first_name, input_data.get("company", "")
+                    ),
+                    "body": body,  # Same body, different subject for A/B
+                }
             
             result = {
                 "lead_id": lead_id,
@@ -184,13 +340,10 @@ Best,
                     "body": body,
                     "template_used": template_key,
                 },
-                "variant": {
-                    "subject": variant_subject,
-                    "body": body,  # Same body, different subject for A/B
-                },
+                "variant": variant,
                 "personalization_score": self._calculate_personalization_score(input_data),
-                "send_recommendation": self._get_send_recommendation(input_data),
-                "generated_at": datetime.now().isoformat(),
+                "send_recommendation": self._get_send_recommendation(tier),
+                "generated_at": NOW.get(),
             }
             
             self._complete_processing(start_time, success=True)
@@ -206,31 +359,19 @@ Best,
             self._complete_processing(start_time, success=False)
             return {"status": "error", "error": str(e)}
     
-    def _select_template(self, lead: Dict) -> str:
+    def _select_template(self, lead: Dict, tier: LeadTier) -> str:
         """Select appropriate template based on lead data."""
         if lead.get("is_follow_up"):
             return "follow_up"
-        
-        tier = lead.get("lead_tier", "COLD").upper()
-        
-        if tier == "HOT":
-            return "hot_lead"
-        elif tier == "WARM":
-            return "warm_lead"
-        else:
-            return "cold_lead"
+        return _TEMPLATE_BY_TIER[tier]
     
     def _generate_variant_subject(
         self, original: str, first_name: str, company: str
     ) -> str:
         """Generate A/B variant subject line."""
-        variants = [
-            f"{first_name} - thought you'd find this interesting",
-            f"Idea for {company}",
-            f"{first_name}, are you thinking about this?",
-            f"Can I share a quick insight, {first_name}?",
-        ]
-        return random.choice(variants)
+        # Pick first, then format only the chosen subject
+        template = self._rng.choice(_VARIANT_SUBJECTS)
+        return template.format(first_name=first_name, company=company)
     
     def _calculate_personalization_score(self, lead: Dict) -> int:
         """Calculate how personalized the email is (0-100)."""
@@ -249,26 +390,7 @@ Best,
         
         return min(score, 100)
     
-    def _get_send_recommendation(self, lead: Dict) -> Dict[str, Any]:
+    def _get_send_recommendation(self, tier: LeadTier) -> Dict[str, Any]:
         """Get recommendation for when to send."""
-        tier = lead.get("lead_tier", "COLD").upper()
-        
         # Best send times (simulated)
-        if tier == "HOT":
-            return {
-                "urgency": "immediate",
-                "best_time": "ASAP",
-                "reason": "Hot lead - respond within 5 minutes for best conversion",
-            }
-        elif tier == "WARM":
-            return {
-                "urgency": "within_24h",
-                "best_time": "Tuesday-Thursday, 9-11 AM",
-                "reason": "Warm lead - personalized outreach yields best results",
-            }
-        else:
-            return {
-                "urgency": "within_week",
-                "best_time": "Tuesday 10 AM or Wednesday 2 PM",
-                "reason": "Cold outreach - timing matters for open rates",
-            }
+        return dict(_SEND_RECOMMENDATIONS[tier])
@@ -9,11 +9,83 @@ BANT:
 - Timeline: What's their buying timeline?
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import uuid
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Any, Optional, List, Iterable
+import os
+import re
+
+import numpy as np
 
 from app.agents.base_agent import BaseAgent
+from app.asloa.clock import NOW
+from app.asloa.jsonio import dumps
+
+
+# Bound formatter for budget amounts in reasons
+_FMT_USD_EXACT = "${:,}".format
+
+# Budget and timeline cases, in the order they are checked
+_BUDGET_CONFIRMED, _BUDGET_MEETS, _BUDGET_BELOW, _BUDGET_UNKNOWN = range(4)
+(
+    _TIMELINE_URGENT,
+    _TIMELINE_ACTIVE,
+    _TIMELINE_LONG,
+    _TIMELINE_SIGNALS,
+    _TIMELINE_UNKNOWN,
+) = range(5)
+_TIMELINE_QUALIFIED = (_TIMELINE_URGENT, _TIMELINE_ACTIVE, _TIMELINE_SIGNALS)
+
+# (status, recommended action, confidence) by number of BANT criteria met
+_DISQUALIFIED = ("DISQUALIFIED", "Deprioritize or remove from pipeline", 0.40)
+_STATUS_BY_COUNT = (
+    _DISQUALIFIED,
+    _DISQUALIFIED,
+    ("NEEDS_NURTURING", "Add to nurture sequence", 0.60),
+    ("PARTIALLY_QUALIFIED", "Schedule discovery call to fill gaps", 0.80),
+    ("QUALIFIED", "Move to sales engagement", 0.95),
+)
+# Fields a triage (include_analysis=False) result keeps
+_TRIAGE_FIELDS = frozenset({
+    "lead_id", "qualification_status", "qualified_criteria", "total_criteria",
+    "confidence", "recommended_action", "qualified_at",
+})
+
+
+@dataclass(slots=True, frozen=True)
+class BantResult:
+    """Outcome of one BANT criterion; converted to a dict only when returned."""
+    qualified: bool
+    score: int
+    reason: str
+    gap: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form; gap is left out when the criterion is met."""
+        data = {"qualified": self.qualified, "score": self.score, "reason": self.reason}
+        if self.gap is not None:
+            data["gap"] = self.gap
+        return data
+
+
+def _has_odd_field(lead: Dict[str, Any]) -> bool:
+    """
+    True if a field batch qualification reads has an unexpected type
+    (e.g. None): a non-numeric budget, a non-string title or needs
+    description, or non-list pain points or urgency signals.
+    """
+    return not (
+        isinstance(lead.get("budget", 0), (int, float))
+        and isinstance(lead.get("contact_title", ""), str)
+        and isinstance(lead.get("needs_description", ""), str)
+        and isinstance(lead.get("pain_points", []), (list, tuple))
+        and isinstance(lead.get("urgency_signals", []), (list, tuple))
+    )
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """Compile keywords into one case-insensitive alternation; search() == any(kw in text.lower())."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
 
 
 class QualificationAgent(BaseAgent):
@@ -45,6 +117,10 @@ class QualificationAgent(BaseAgent):
             ],
             "urgent_timeline_days": 90,   # Within 3 months = urgent
         }
+        
+        # Keyword lists compiled once; each check is a single scan of the text
+        self._authority_re = _keyword_pattern(self.thresholds["authority_keywords"])
+        self._need_re = _keyword_pattern(self.thresholds["need_keywords"])
     
     def process(
         self,
@@ -68,223 +144,408 @@ class QualificationAgent(BaseAgent):
         start_time = self._start_processing()
         
         try:
-            lead_id = input_data.get("lead_id", f"lead-{uuid.uuid4().hex[:8]}")
-            
-            # Evaluate each BANT component
-            budget_result = self._evaluate_budget(input_data)
-            authority_result = self._evaluate_authority(input_data)
-            need_result = self._evaluate_need(input_data)
-            timeline_result = self._evaluate_timeline(input_data)
+            result = self._qualify(input_data, NOW.get())
             
-            # Count qualified criteria
-            qualified_count = sum([
-                budget_result["qualified"],
-                authority_result["qualified"],
-                need_result["qualified"],
-                timeline_result["qualified"],
-            ])
+            self._complete_processing(start_time, success=True)
+            self._last_output = result
             
-            # Determine status
-            if qualified_count == 4:
-                status = "QUALIFIED"
-                action = "Move to sales engagement"
-                confidence = 0.95
-            elif qualified_count >= 3:
-                status = "PARTIALLY_QUALIFIED"
-                action = "Schedule discovery call to fill gaps"
-                confidence = 0.80
-            elif qualified_count >= 2:
-                status = "NEEDS_NURTURING"
-                action = "Add to nurture sequence"
-                confidence = 0.60
-            else:
-                status = "DISQUALIFIED"
-                action = "Deprioritize or remove from pipeline"
-                confidence = 0.40
+            return {
+                "status": "success",
+                "qualification": result,
+            }
             
-            # Generate next steps
-            next_steps = self._generate_next_steps(
-                budget_result, authority_result, 
-                need_result, timeline_result
+        except Exception as e:
+            self._log_error(e, "Qualification failed")
+            self._complete_processing(start_time, success=False)
+            return {"status": "error", "error": str(e)}
+    
+    def process_json(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Qualify one lead and return the process() response as JSON bytes."""
+        return dumps(self.process(input_data, context))
+    
+    def process_batch(
+        self, leads: List[Dict[str, Any]], include_analysis: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Qualify many leads at once.
+        
+        Same per-lead output as process(); budget and timeline cases and
+        the qualified-criteria counts are computed over arrays, and all
+        results share one qualified_at timestamp.
+        
+        With include_analysis=False (triage), each result carries only the
+        status fields; no BANT reasons or next steps are formatted.
+        
+        Leads with a field of an unexpected type (e.g. a null budget or
+        contact title) are qualified one at a time exactly as process()
+        would, so a lead process() rejects gets an empty result and its
+        error under "errors".
+        """
+        start_time = self._start_processing()
+        
+        try:
+            now_iso = NOW.get()
+            results, errors = self._map_batch(
+                leads,
+                lambda batch: self._qualify_columns(batch, include_analysis, now_iso),
+                lambda lead: self._qualify_one(lead, include_analysis, now_iso),
+                _has_odd_field,
+                "Qualification failed",
             )
             
-            result = {
-                "lead_id": lead_id,
-                "qualification_status": status,
-                "qualified_criteria": qualified_count,
-                "total_criteria": 4,
-                "confidence": confidence,
-                "recommended_action": action,
-                "bant_analysis": {
-                    "budget": budget_result,
-                    "authority": authority_result,
-                    "need": need_result,
-                    "timeline": timeline_result,
-                },
-                "next_steps": next_steps,
-                "qualified_at": datetime.now().isoformat(),
-            }
-            
             self._complete_processing(start_time, success=True)
-            self._last_output = result
+            if results:
+                self._last_output = results[-1]
             
             return {
                 "status": "success",
-                "qualification": result,
+                "qualification": results,
+                "errors": errors,
             }
             
         except Exception as e:
-            self._log_error(e, "Qualification failed")
+            self._log_error(e, "Batch qualification failed")
             self._complete_processing(start_time, success=False)
             return {"status": "error", "error": str(e)}
     
-    def _evaluate_budget(self, lead: Dict) -> Dict[str, Any]:
+    def _qualify_columns(
+        self, leads: List[Dict[str, Any]], include_analysis: bool, now_iso: str
+    ) -> List[Dict[str, Any]]:
+        """Qualify leads over column arrays; no lead has an odd field."""
+        n = len(leads)
+        min_budget = self.thresholds["min_budget"]
+        urgent_days = self.thresholds["urgent_timeline_days"]
+        
+        # Budget and timeline cases over column arrays
+        budget_values = [lead.get("budget", 0) for lead in leads]
+        timeline_values = [lead.get("timeline") for lead in leads]
+        urgency_values = [lead.get("urgency_signals", []) for lead in leads]
+        
+        budgets = np.array(budget_values, dtype=np.float64)
+        confirmed = np.fromiter(
+            (bool(lead.get("budget_confirmed", False)) for lead in leads), dtype=bool, count=n
+        )
+        budget_case = np.where(
+            budgets >= min_budget,
+            np.where(confirmed, _BUDGET_CONFIRMED, _BUDGET_MEETS),
+            np.where(budgets > 0, _BUDGET_BELOW, _BUDGET_UNKNOWN),
+        )
+        
+        numeric = np.fromiter(
+            (isinstance(t, (int, float)) for t in timeline_values), dtype=bool, count=n
+        )
+        days = np.array(
+            [t if ok else 0 for t, ok in zip(timeline_values, numeric.tolist())], dtype=np.float64
+        )
+        has_urgency = np.fromiter((bool(u) for u in urgency_values), dtype=bool, count=n)
+        timeline_case = np.where(
+            numeric,
+            np.select([days <= urgent_days, days <= 180], [_TIMELINE_URGENT, _TIMELINE_ACTIVE], _TIMELINE_LONG),
+            np.where(has_urgency, _TIMELINE_SIGNALS, _TIMELINE_UNKNOWN),
+        )
+        
+        # Keyword-driven criteria stay per lead
+        if include_analysis:
+            authority_results = [self._evaluate_authority(lead) for lead in leads]
+            need_results = [self._evaluate_need(lead) for lead in leads]
+            authority_ok = (r.qualified for r in authority_results)
+            need_ok = (r.qualified for r in need_results)
+        else:
+            authority_ok = (self._has_authority(lead) for lead in leads)
+            need_ok = (self._has_need(lead) for lead in leads)
+        
+        qualified_count = (
+            (budget_case <= _BUDGET_MEETS).astype(np.int64)
+            + np.isin(timeline_case, _TIMELINE_QUALIFIED)
+            + np.fromiter(authority_ok, dtype=bool, count=n)
+            + np.fromiter(need_ok, dtype=bool, count=n)
+        ).tolist()
+        budget_case = budget_case.tolist()
+        timeline_case = timeline_case.tolist()
+        
+        results = []
+        for i, lead in enumerate(leads):
+            lead_id = lead["lead_id"] if "lead_id" in lead else f"lead-{os.urandom(4).hex()}"
+            if not include_analysis:
+                status, action, confidence = _STATUS_BY_COUNT[qualified_count[i]]
+                results.append({
+                    "lead_id": lead_id,
+                    "qualification_status": status,
+                    "qualified_criteria": qualified_count[i],
+                    "total_criteria": 4,
+                    "confidence": confidence,
+                    "recommended_action": action,
+                    "qualified_at": now_iso,
+                })
+                continue
+            results.append(self._build_result(
+                lead_id,
+                self._describe_budget(budget_case[i], budget_values[i]),
+                authority_results[i],
+                need_results[i],
+                self._describe_timeline(timeline_case[i], timeline_values[i], urgency_values[i]),
+                qualified_count[i],
+                now_iso,
+            ))
+        return results
+    
+    def _qualify_one(self, lead: Dict[str, Any], include_analysis: bool, now_iso: str) -> Dict[str, Any]:
+        """Qualify one lead, keeping only the triage fields unless analysis is wanted."""
+        result = self._qualify(lead, now_iso)
+        if include_analysis:
+            return result
+        return {key: value for key, value in result.items() if key in _TRIAGE_FIELDS}
+    
+    def _qualify(self, lead: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+        """Run the BANT evaluation for one lead."""
+        # Only generate an id when the caller did not supply one
+        if "lead_id" in lead:
+            lead_id = lead["lead_id"]
+        else:
+            lead_id = f"lead-{os.urandom(4).hex()}"
+        
+        # Evaluate each BANT component
+        budget_result = self._evaluate_budget(lead)
+        authority_result = self._evaluate_authority(lead)
+        need_result = self._evaluate_need(lead)
+        timeline_result = self._evaluate_timeline(lead)
+        
+        # Count qualified criteria
+        qualified_count = sum([
+            budget_result.qualified,
+            authority_result.qualified,
+            need_result.qualified,
+            timeline_result.qualified,
+        ])
+        
+        return self._build_result(
+            lead_id, budget_result, authority_result, need_result, timeline_result,
+            qualified_count, now_iso,
+        )
+    
+    def _build_result(
+        self,
+        lead_id: str,
+        budget_result: BantResult,
+        authority_result: BantResult,
+        need_result: BantResult,
+        timeline_result: BantResult,
+        qualified_count: int,
+        now_iso: str,
+    ) -> Dict[str, Any]:
+        """Assemble the qualification result from the four BANT results."""
+        # Determine status
+        status, action, confidence = _STATUS_BY_COUNT[qualified_count]
+        
+        # Generate next steps
+        next_steps = self._generate_next_steps(
+            budget_result, authority_result, 
+            need_result, timeline_result
+        )
+        
+        return {
+            "lead_id": lead_id,
+            "qualification_status": status,
+            "qualified_criteria": qualified_count,
+            "total_criteria": 4,
+            "confidence": confidence,
+            "recommended_action": action,
+            "bant_analysis": {
+                "budget": budget_result.to_dict(),
+                "authority": authority_result.to_dict(),
+                "need": need_result.to_dict(),
+                "timeline": timeline_result.to_dict(),
+            },
+            "next_steps": next_steps,
+            "qualified_at": now_iso,
+        }
+    
+    def _evaluate_budget(self, lead: Dict) -> BantResult:
         """Evaluate budget qualification."""
         budget = lead.get("budget", 0)
-        budget_confirmed = lead.get("budget_confirmed", False)
         
-        if budget_confirmed and budget >= self.thresholds["min_budget"]:
-            return {
-                "qualified": True,
-                "score": 100,
-                "reason": f"Budget of ${budget:,} confirmed",
-            }
-        elif budget >= self.thresholds["min_budget"]:
-            return {
-                "qualified": True,
-                "score": 80,
-                "reason": f"Estimated budget of ${budget:,} meets threshold",
-            }
+        if budget >= self.thresholds["min_budget"]:
+            case = _BUDGET_CONFIRMED if lead.get("budget_confirmed", False) else _BUDGET_MEETS
         elif budget > 0:
-            return {
-                "qualified": False,
-                "score": 40,
-                "reason": f"Budget of ${budget:,} below threshold",
-                "gap": f"Need to confirm budget >= ${self.thresholds['min_budget']:,}",
-            }
+            case = _BUDGET_BELOW
         else:
-            return {
-                "qualified": False,
-                "score": 20,
-                "reason": "Budget unknown",
-                "gap": "Need to discover budget during call",
-            }
+            case = _BUDGET_UNKNOWN
+        return self._describe_budget(case, budget)
     
-    def _evaluate_authority(self, lead: Dict) -> Dict[str, Any]:
+    def _describe_budget(self, case: int, budget) -> BantResult:
+        """Build the budget result for an already classified case."""
+        if case == _BUDGET_CONFIRMED:
+            return BantResult(
+                qualified=True,
+                score=100,
+                reason=f"Budget of {_FMT_USD_EXACT(budget)} confirmed",
+            )
+        elif case == _BUDGET_MEETS:
+            return BantResult(
+                qualified=True,
+                score=80,
+                reason=f"Estimated budget of {_FMT_USD_EXACT(budget)} meets threshold",
+            )
+        elif case == _BUDGET_BELOW:
+            return BantResult(
+                qualified=False,
+                score=40,
+                reason=f"Budget of {_FMT_USD_EXACT(budget)} below threshold",
+                gap=f"Need to confirm budget >= {_FMT_USD_EXACT(self.thresholds['min_budget'])}",
+            )
+        else:
+            return BantResult(
+                qualified=False,
+                score=20,
+                reason="Budget unknown",
+                gap="Need to discover budget during call",
+            )
+    
+    def _has_authority(self, lead: Dict) -> bool:
+        """Authority criterion only, without building the BantResult."""
+        if lead.get("is_decision_maker", None) is True:
+            return True
+        return self._authority_re.search(lead.get("contact_title", "")) is not None
+    
+    def _has_need(self, lead: Dict) -> bool:
+        """Need criterion only, without building the BantResult."""
+        if len(lead.get("pain_points", [])) > 0:
+            return True
+        return self._need_re.search(lead.get("needs_description", "")) is not None
+    
+    def _evaluate_authority(self, lead: Dict) -> BantResult:
         """Evaluate authority/decision-maker status."""
-        title = lead.get("contact_title", "").lower()
+        title = lead.get("contact_title", "")
         is_dm = lead.get("is_decision_maker", None)
         
         if is_dm is True:
-            return {
-                "qualified": True,
-                "score": 100,
-                "reason": "Confirmed decision maker",
-            }
+            return BantResult(
+                qualified=True,
+                score=100,
+                reason="Confirmed decision maker",
+            )
         
-        has_authority_title = any(
-            kw in title for kw in self.thresholds["authority_keywords"]
-        )
+        has_authority_title = self._authority_re.search(title) is not None
         
         if has_authority_title:
-            return {
-                "qualified": True,
-                "score": 85,
-                "reason": f"Title '{lead.get('contact_title', '')}' suggests decision-making authority",
-            }
+            return BantResult(
+                qualified=True,
+                score=85,
+                reason=f"Title '{lead.get('contact_title', '')}' suggests decision-making authority",
+            )
         else:
-            return {
-                "qualified": False,
-                "score": 30,
-                "reason": "Contact may not be decision maker",
-                "gap": "Need to identify & engage decision maker",
-            }
+            return BantResult(
+                qualified=False,
+                score=30,
+                reason="Contact may not be decision maker",
+                gap="Need to identify & engage decision maker",
+            )
     
-    def _evaluate_need(self, lead: Dict) -> Dict[str, Any]:
+    def _evaluate_need(self, lead: Dict) -> BantResult:
         """Evaluate if there's a clear need."""
         pain_points = lead.get("pain_points", [])
-        needs_desc = lead.get("needs_description", "").lower()
+        needs_desc = lead.get("needs_description", "")
         
         has_pain = len(pain_points) > 0
-        has_keywords = any(
-            kw in needs_desc for kw in self.thresholds["need_keywords"]
-        )
         
         if has_pain and len(pain_points) >= 2:
-            return {
-                "qualified": True,
-                "score": 100,
-                "reason": f"Clear need identified: {', '.join(pain_points[:3])}",
-            }
-        elif has_pain or has_keywords:
-            return {
-                "qualified": True,
-                "score": 75,
-                "reason": "Need indicators present",
-            }
+            return BantResult(
+                qualified=True,
+                score=100,
+                reason=f"Clear need identified: {', '.join(islice(pain_points, 3))}",
+            )
+        
+        # Distinct need keywords in order of first appearance
+        matched = list(dict.fromkeys(kw.lower() for kw in self._need_re.findall(needs_desc)))
+        
+        if has_pain or matched:
+            reason = "Need indicators present"
+            if matched:
+                reason += f": {', '.join(islice(matched, 3))}"
+            return BantResult(
+                qualified=True,
+                score=75,
+                reason=reason,
+            )
         else:
-            return {
-                "qualified": False,
-                "score": 25,
-                "reason": "No clear need identified",
-                "gap": "Need to uncover pain points during discovery",
-            }
+            return BantResult(
+                qualified=False,
+                score=25,
+                reason="No clear need identified",
+                gap="Need to uncover pain points during discovery",
+            )
     
-    def _evaluate_timeline(self, lead: Dict) -> Dict[str, Any]:
+    def _evaluate_timeline(self, lead: Dict) -> BantResult:
         """Evaluate buying timeline."""
         timeline = lead.get("timeline")  # Can be days or text
         urgency = lead.get("urgency_signals", [])
         
-        # Handle numeric timeline
+        # Handle numeric timeline, then urgency signals
         if isinstance(timeline, (int, float)):
             if timeline <= self.thresholds["urgent_timeline_days"]:
-                return {
-                    "qualified": True,
-                    "score": 100,
-                    "reason": f"Buying timeline within {int(timeline)} days",
-                }
+                case = _TIMELINE_URGENT
             elif timeline <= 180:
-                return {
-                    "qualified": True,
-                    "score": 70,
-                    "reason": f"Timeline of {int(timeline)} days - active evaluation",
-                }
+                case = _TIMELINE_ACTIVE
             else:
-                return {
-                    "qualified": False,
-                    "score": 30,
-                    "reason": f"Long timeline of {int(timeline)} days",
-                    "gap": "Keep warm for future engagement",
-                }
-        
-        # Handle urgency signals
-        if urgency and len(urgency) > 0:
-            return {
-                "qualified": True,
-                "score": 80,
-                "reason": f"Urgency signals: {', '.join(urgency[:2])}",
-            }
+                case = _TIMELINE_LONG
+        elif urgency:
+            case = _TIMELINE_SIGNALS
+        else:
+            case = _TIMELINE_UNKNOWN
+        return self._describe_timeline(case, timeline, urgency)
+    
+    def _describe_timeline(self, case: int, timeline, urgency: List[str]) -> BantResult:
+        """Build the timeline result for an already classified case."""
+        if case == _TIMELINE_URGENT:
+            return BantResult(
+                qualified=True,
+                score=100,
+                reason=f"Buying timeline within {int(timeline)} days",
+            )
+        elif case == _TIMELINE_ACTIVE:
+            return BantResult(
+                qualified=True,
+                score=70,
+                reason=f"Timeline of {int(timeline)} days - active evaluation",
+            )
+        elif case == _TIMELINE_LONG:
+            return BantResult(
+                qualified=False,
+                score=30,
+                reason=f"Long timeline of {int(timeline)} days",
+                gap="Keep warm for future engagement",
+            )
+        elif case == _TIMELINE_SIGNALS:
+            return BantResult(
+                qualified=True,
+                score=80,
+                reason=f"Urgency signals: {', '.join(islice(urgency, 2))}",
+            )
         
-        return {
-            "qualified": False,
-            "score": 20,
-            "reason": "Timeline unknown",
-            "gap": "Need to establish timeline expectation",
-        }
+        return BantResult(
+            qualified=False,
+            score=20,
+            reason="Timeline unknown",
+            gap="Need to establish timeline expectation",
+        )
     
     def _generate_next_steps(
-        self, budget: Dict, authority: Dict, need: Dict, timeline: Dict
+        self, budget: BantResult, authority: BantResult, need: BantResult, timeline: BantResult
     ) -> List[str]:
         """Generate actionable next steps based on gaps."""
         steps = []
         
-        if not budget["qualified"]:
+        if not budget.qualified:
             steps.append("Discover budget during qualification call")
-        if not authority["qualified"]:
+        if not authority.qualified:
             steps.append("Identify and engage the decision maker")
-        if not need["qualified"]:
+        if not need.qualified:
             steps.append("Conduct discovery to uncover pain points")
-        if not timeline["qualified"]:
+        if not timeline.qualified:
             steps.append("Establish buying timeline and urgency")
         
         if not steps:
@@ -10,11 +10,92 @@ Capabilities:
 - News & trigger events
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import uuid
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple
 
 from app.agents.base_agent import BaseAgent
+from app.asloa.clock import NOW
+from app.asloa.jsonio import dumps
+from app.asloa.text import first_band_pattern
+
+
+# Buying-committee role keywords, in precedence order
+_ROLE_KEYWORDS = (
+    ("economic", ("cfo", "finance", "budget")),
+    ("technical", ("cto", "engineer", "technical", "developer")),
+    ("decision", ("ceo", "founder", "owner", "president")),
+    ("blocker", ("security", "compliance", "legal")),
+    ("user", ("manager", "director", "head")),
+)
+_ROLE_NAMES = {
+    "economic": "Economic Buyer",
+    "technical": "Technical Buyer",
+    "decision": "Decision Maker",
+    "blocker": "Blocker",
+    "user": "User Buyer",
+}
+_ROLE_RE = first_band_pattern(_ROLE_KEYWORDS)
+
+# Common pain points by industry
+_INDUSTRY_PAIN_POINTS = MappingProxyType({
+    "technology": (
+        "Scaling infrastructure",
+        "Developer productivity",
+        "Technical debt",
+        "Security vulnerabilities",
+    ),
+    "saas": (
+        "Customer churn",
+        "User onboarding",
+        "Feature prioritization",
+        "Revenue expansion",
+    ),
+    "manufacturing": (
+        "Operational efficiency",
+        "Supply chain visibility",
+        "Quality control",
+        "Equipment downtime",
+    ),
+    "retail": (
+        "Inventory management",
+        "Customer experience",
+        "Omnichannel integration",
+        "Labor scheduling",
+    ),
+    "healthcare": (
+        "Patient wait times",
+        "Staff scheduling",
+        "Compliance requirements",
+        "Data interoperability",
+    ),
+    "fintech": (
+        "Regulatory compliance",
+        "Fraud detection",
+        "Customer acquisition cost",
+        "Operational risk",
+    ),
+})
+_DEFAULT_PAIN_POINTS = _INDUSTRY_PAIN_POINTS["technology"]
+
+# Typical buying committee roles by company tier: (role, typical_title, influence)
+_COMMITTEE_TEMPLATES = MappingProxyType({
+    "enterprise": (
+        ("Economic Buyer", "CFO/VP Finance", "high"),
+        ("Technical Buyer", "CTO/VP Engineering", "high"),
+        ("User Buyer", "Director/Manager", "medium"),
+        ("Champion", "End User", "medium"),
+        ("Blocker", "IT Security/Procurement", "high"),
+    ),
+    "mid_market": (
+        ("Decision Maker", "CEO/Founder", "high"),
+        ("Technical Evaluator", "CTO/Tech Lead", "medium"),
+        ("User", "Team Lead", "low"),
+    ),
+    "smb": (
+        ("Owner/Decision Maker", "Founder/CEO", "high"),
+    ),
+})
 
 
 class ResearchAgent(BaseAgent):
@@ -31,64 +112,8 @@ class ResearchAgent(BaseAgent):
     def __init__(self):
         super().__init__("research")
         
-        # Common pain points by industry
-        self.industry_pain_points = {
-            "technology": [
-                "Scaling infrastructure",
-                "Developer productivity",
-                "Technical debt",
-                "Security vulnerabilities",
-            ],
-            "saas": [
-                "Customer churn",
-                "User onboarding",
-                "Feature prioritization",
-                "Revenue expansion",
-            ],
-            "manufacturing": [
-                "Operational efficiency",
-                "Supply chain visibility",
-                "Quality control",
-                "Equipment downtime",
-            ],
-            "retail": [
-                "Inventory management",
-                "Customer experience",
-                "Omnichannel integration",
-                "Labor scheduling",
-            ],
-            "healthcare": [
-                "Patient wait times",
-                "Staff scheduling",
-                "Compliance requirements",
-                "Data interoperability",
-            ],
-            "fintech": [
-                "Regulatory compliance",
-                "Fraud detection",
-                "Customer acquisition cost",
-                "Operational risk",
-            ],
-        }
-        
-        # Typical buying committee roles
-        self.committee_templates = {
-            "enterprise": [
-                {"role": "Economic Buyer", "typical_title": "CFO/VP Finance", "influence": "high"},
-                {"role": "Technical Buyer", "typical_title": "CTO/VP Engineering", "influence": "high"},
-                {"role": "User Buyer", "typical_title": "Director/Manager", "influence": "medium"},
-                {"role": "Champion", "typical_title": "End User", "influence": "medium"},
-                {"role": "Blocker", "typical_title": "IT Security/Procurement", "influence": "high"},
-            ],
-            "mid_market": [
-                {"role": "Decision Maker", "typical_title": "CEO/Founder", "influence": "high"},
-                {"role": "Technical Evaluator", "typical_title": "CTO/Tech Lead", "influence": "medium"},
-                {"role": "User", "typical_title": "Team Lead", "influence": "low"},
-            ],
-            "smb": [
-                {"role": "Owner/Decision Maker", "typical_title": "Founder/CEO", "influence": "high"},
-            ],
-        }
+        self.industry_pain_points = _INDUSTRY_PAIN_POINTS
+        self.committee_templates = _COMMITTEE_TEMPLATES
     
     def process(
         self,
@@ -111,51 +136,91 @@ class ResearchAgent(BaseAgent):
         start_time = self._start_processing()
         
         try:
-            company = input_data.get("company", "Unknown Company")
-            industry = input_data.get("industry", "technology").lower()
-            size = input_data.get("company_size", 100)
-            
-            # Build company profile
-            company_profile = self._build_company_profile(input_data)
+            result = self._research(input_data, NOW.get())
             
-            # Map buying committee
-            buying_committee = self._map_buying_committee(input_data)
-            
-            # Identify pain points
-            pain_points = self._identify_pain_points(input_data)
+            self._complete_processing(start_time, success=True)
+            self._last_output = result
             
-            # Generate trigger events (simulated)
-            triggers = self._identify_triggers(input_data)
+            return {
+                "status": "success",
+                "research": result,
+            }
             
-            # Generate personalization hooks
-            personalization = self._generate_personalization_hooks(
-                company_profile, pain_points, triggers
+        except Exception as e:
+            self._log_error(e, "Research failed")
+            self._complete_processing(start_time, success=False)
+            return {"status": "error", "error": str(e)}
+    
+    def process_json(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Research one lead and return the process() response as JSON bytes."""
+        return dumps(self.process(input_data, context))
+    
+    def process_batch(self, leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Research many prospects at once.
+        
+        Same per-lead output as process(); all results share one
+        researched_at timestamp.
+        A lead that fails gets an empty result and its error under
+        "errors" (keyed by position); the other leads are unaffected.
+        """
+        start_time = self._start_processing()
+        
+        try:
+            now_iso = NOW.get()
+            results, errors = self._map_isolated(
+                lambda lead: self._research(lead, now_iso), leads, "Research failed"
             )
             
-            result = {
-                "company": company,
-                "company_profile": company_profile,
-                "buying_committee": buying_committee,
-                "pain_points": pain_points,
-                "triggers": triggers,
-                "personalization_hooks": personalization,
-                "research_confidence": 0.75,
-                "researched_at": datetime.now().isoformat(),
-            }
-            
             self._complete_processing(start_time, success=True)
-            self._last_output = result
+            if results:
+                self._last_output = results[-1]
             
             return {
                 "status": "success",
-                "research": result,
+                "research": results,
+                "errors": errors,
             }
             
         except Exception as e:
-            self._log_error(e, "Research failed")
+            self._log_error(e, "Batch research failed")
             self._complete_processing(start_time, success=False)
             return {"status": "error", "error": str(e)}
     
+    def _research(self, lead: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+        """Gather intelligence for one prospect."""
+        # Build company profile
+        company_profile = self._build_company_profile(lead)
+        
+        # Map buying committee
+        buying_committee = self._map_buying_committee(lead)
+        
+        # Identify pain points
+        pain_points = self._identify_pain_points(lead)
+        
+        # Generate trigger events (simulated)
+        triggers = self._identify_triggers(lead)
+        
+        # Generate personalization hooks
+        personalization = self._generate_personalization_hooks(
+            company_profile, pain_points, triggers
+        )
+        
+        return {
+            "company": lead.get("company", "Unknown Company"),
+            "company_profile": company_profile,
+            "buying_committee": buying_committee,
+            "pain_points": pain_points,
+            "triggers": triggers,
+            "personalization_hooks": personalization,
+            "research_confidence": 0.75,
+            "researched_at": now_iso,
+        }
+    
     def _build_company_profile(self, lead: Dict) -> Dict[str, Any]:
         """Build comprehensive company profile."""
         size = lead.get("company_size", 100)
@@ -195,92 +260,86 @@ class ResearchAgent(BaseAgent):
         else:
             template = self.committee_templates["smb"]
         
-        committee = []
+        title = lead.get("contact_title", "")
+        title_lower = title.lower()
         primary_contact = {
             "name": lead.get("contact_name", "Unknown"),
-            "title": lead.get("contact_title", ""),
+            "title": title,
             "email": lead.get("contact_email", ""),
             "is_primary": True,
-            "role": self._infer_role(lead.get("contact_title", "")),
-            "influence": "high" if "chief" in lead.get("contact_title", "").lower() else "medium",
+            "role": self._infer_role(title_lower),
+            "influence": "high" if "chief" in title_lower else "medium",
         }
-        committee.append(primary_contact)
         
-        # Add additional known contacts
-        for contact in lead.get("additional_contacts", []):
-            committee.append({
+        # Add additional known contacts (sized in one go, no per-append resizing)
+        infer_role = self._infer_role
+        committee = [primary_contact]
+        committee.extend([
+            {
                 "name": contact.get("name", "Unknown"),
-                "title": contact.get("title", ""),
+                "title": contact_title,
                 "email": contact.get("email", ""),
                 "is_primary": False,
-                "role": self._infer_role(contact.get("title", "")),
+                "role": infer_role(contact_title.lower()),
                 "influence": "medium",
-            })
+            }
+            for contact in lead.get("additional_contacts", [])
+            for contact_title in (contact.get("title", ""),)
+        ])
         
         # Add unknown stakeholders from template
-        for template_role in template:
-            if not any(c.get("role") == template_role["role"] for c in committee):
+        present_roles = {c.get("role") for c in committee}
+        for role, typical_title, influence in template:
+            if role not in present_roles:
+                present_roles.add(role)
                 committee.append({
                     "name": "To be identified",
-                    "title": template_role["typical_title"],
-                    "role": template_role["role"],
-                    "influence": template_role["influence"],
+                    "title": typical_title,
+                    "role": role,
+                    "influence": influence,
                     "is_primary": False,
                     "needs_identification": True,
                 })
         
         return committee
     
-    def _infer_role(self, title: str) -> str:
-        """Infer buying committee role from job title."""
-        title_lower = title.lower()
-        
-        if any(x in title_lower for x in ["cfo", "finance", "budget"]):
-            return "Economic Buyer"
-        elif any(x in title_lower for x in ["cto", "engineer", "technical", "developer"]):
-            return "Technical Buyer"
-        elif any(x in title_lower for x in ["ceo", "founder", "owner", "president"]):
-            return "Decision Maker"
-        elif any(x in title_lower for x in ["security", "compliance", "legal"]):
-            return "Blocker"
-        elif any(x in title_lower for x in ["manager", "director", "head"]):
-            return "User Buyer"
-        else:
-            return "Champion"
+    def _infer_role(self, title_lower: str) -> str:
+        """Infer buying committee role from an already lower-cased job title."""
+        match = _ROLE_RE.match(title_lower)
+        return _ROLE_NAMES[match.lastgroup] if match else "Champion"
     
     def _identify_pain_points(self, lead: Dict) -> List[Dict[str, Any]]:
         """Identify likely pain points based on industry."""
         industry = lead.get("industry", "technology").lower()
+        mentioned = tuple(lead.get("pain_points", []))
         
+        # Rows are cached and shared, so hand out copies
+        return [row.copy() for row in self._pain_points_for(industry, mentioned)]
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _pain_points_for(
+        industry: str, mentioned: Tuple[str, ...]
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Mentioned pain points, then up to three inferred from the industry."""
         # Get industry-specific pain points
-        industry_pains = self.industry_pain_points.get(
-            industry, 
-            self.industry_pain_points["technology"]
-        )
-        
-        # Add any explicitly mentioned pain points
-        mentioned = lead.get("pain_points", [])
-        
-        pain_points = []
+        industry_pains = _INDUSTRY_PAIN_POINTS.get(industry, _DEFAULT_PAIN_POINTS)
         
         # Add mentioned pain points with high confidence
-        for pain in mentioned:
-            pain_points.append({
-                "pain_point": pain,
-                "confidence": "high",
-                "source": "mentioned",
-            })
+        pain_points = [
+            {"pain_point": pain, "confidence": "high", "source": "mentioned"}
+            for pain in mentioned
+        ]
         
-        # Add inferred pain points
-        for pain in industry_pains[:3]:
-            if pain not in mentioned:
-                pain_points.append({
-                    "pain_point": pain,
-                    "confidence": "medium",
-                    "source": "inferred_from_industry",
-                })
+        # Add inferred pain points not already mentioned (one hashed lookup each)
+        mentioned_set = set(mentioned)
+        pain_points.extend(
+            {"pain_point": pain, "confidence": "medium", "source": "inferred_from_industry"}
+            for pain in industry_pains[:3]
+            if pain not in mentioned_set
+        )
         
-        return pain_points
+        return tuple(pain_points)
     
     def _identify_triggers(self, lead: Dict) -> List[Dict[str, Any]]:
         """Identify buying trigger events (simulated)."""
@@ -10,12 +10,68 @@ Assignment Criteria:
 - Chemistry fit
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import uuid
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
+from dataclasses import dataclass
+import os
 import random
 
+import numpy as np
+
 from app.agents.base_agent import BaseAgent
+from app.asloa.agents._kernels import score_reps
+from app.asloa.clock import NOW
+from app.asloa.tiers import LeadTier
+
+
+# Rep score components, in breakdown order
+_SCORE_FIELDS = ("capacity", "expertise", "win_rate", "deal_size_fit", "territory")
+
+# Capacity score (0-25) by capacity-used band: <0.5, <0.7, <0.9, rest
+_CAPACITY_BREAKS = np.array([0.5, 0.7, 0.9])
+_CAPACITY_SCORES = np.array([25, 20, 10, 5])
+
+# Expected response time by LeadTier, then (has bandwidth, busy)
+_BUSY_AT = 0.7
+_RESPONSE_TIMES = (
+    ("Within 24 hours", "Within 24 hours"),
+    ("Within 2 hours", "Within 4 hours"),
+    ("Within 5 minutes", "Within 30 minutes"),
+)
+
+
+def _classify_segment(company_size: int) -> str:
+    """Market segment for a company size."""
+    if company_size >= 1000:
+        return "enterprise"
+    elif company_size >= 100:
+        return "mid_market"
+    elif company_size >= 20:
+        return "smb"
+    return "startup"
+
+
+@dataclass(slots=True)
+class SalesRep:
+    """Sales rep leads can be routed to."""
+    rep_id: str
+    name: str
+    email: str
+    current_deals: int
+    capacity: int
+    win_rate: float
+    specialties: Tuple[str, ...]
+    territories: Tuple[str, ...]
+    avg_deal_size: int
+
+
+class RepScore(NamedTuple):
+    """One rep's score for a lead, by component (fields follow _SCORE_FIELDS)."""
+    capacity: int
+    expertise: int
+    win_rate: int
+    deal_size_fit: int
+    territory: int
+    total: int
 
 
 class RoutingAgent(BaseAgent):
@@ -34,50 +90,109 @@ class RoutingAgent(BaseAgent):
         
         # Simulated sales team (in production, this would come from CRM)
         self.sales_team = [
-            {
-                "rep_id": "rep-001",
-                "name": "Sarah Johnson",
-                "email": "sarah@company.com",
-                "current_deals": 12,
-                "capacity": 20,
-                "win_rate": 0.35,
-                "specialties": ["enterprise", "technology", "saas"],
-                "territories": ["north", "west"],
-                "avg_deal_size": 75000,
-            },
-            {
-                "rep_id": "rep-002",
-                "name": "Raj Patel",
-                "email": "raj@company.com",
-                "current_deals": 8,
-                "capacity": 15,
-                "win_rate": 0.42,
-                "specialties": ["mid_market", "fintech", "healthcare"],
-                "territories": ["south", "east"],
-                "avg_deal_size": 45000,
-            },
-            {
-                "rep_id": "rep-003",
-                "name": "Mike Chen",
-                "email": "mike@company.com",
-                "current_deals": 15,
-                "capacity": 18,
-                "win_rate": 0.38,
-                "specialties": ["enterprise", "manufacturing", "retail"],
-                "territories": ["west", "international"],
-                "avg_deal_size": 120000,
-            },
-            {
-                "rep_id": "rep-004",
-                "name": "Priya Sharma",
-                "email": "priya@company.com",
-                "current_deals": 5,
-                "capacity": 12,
-                "win_rate": 0.48,
-                "specialties": ["smb", "startup", "technology"],
-                "territories": ["all"],
-                "avg_deal_size": 25000,
-            },
+            SalesRep(
+                rep_id="rep-001",
+                name="Sarah Johnson",
+                email="sarah@company.com",
+                current_deals=12,
+                capacity=20,
+                win_rate=0.35,
+                specialties=("enterprise", "technology", "saas"),
+                territories=("north", "west"),
+                avg_deal_size=75000,
+            ),
+            SalesRep(
+                rep_id="rep-002",
+                name="Raj Patel",
+                email="raj@company.com",
+                current_deals=8,
+                capacity=15,
+                win_rate=0.42,
+                specialties=("mid_market", "fintech", "healthcare"),
+                territories=("south", "east"),
+                avg_deal_size=45000,
+            ),
+            SalesRep(
+                rep_id="rep-003",
+                name="Mike Chen",
+                email="mike@company.com",
+                current_deals=15,
+                capacity=18,
+                win_rate=0.38,
+                specialties=("enterprise", "manufacturing", "retail"),
+                territories=("west", "international"),
+                avg_deal_size=120000,
+            ),
+            SalesRep(
+                rep_id="rep-004",
+                name="Priya Sharma",
+                email="priya@company.com",
+                current_deals=5,
+                capacity=12,
+                win_rate=0.48,
+                specialties=("smb", "startup", "technology"),
+                territories=("all",),
+                avg_deal_size=25000,
+            ),
+        ]
+        self._build_team_arrays()
+    
+    def _build_team_arrays(self) -> None:
+        """Lay the sales team out as parallel arrays (one slot per rep) for scoring."""
+        team = self.sales_team
+        self._capacity_used = np.array(
+            [rep.current_deals / rep.capacity for rep in team], dtype=np.float64
+        )
+        # Win rate score (0-20); 0.4 win rate = 20 points
+        self._win_rate_score = np.array(
+            [int(rep.win_rate * 50) for rep in team], dtype=np.int64
+        )
+        self._avg_deal_size = np.array([rep.avg_deal_size for rep in team], dtype=np.float64)
+        self._capacity_score = _CAPACITY_SCORES[
+            np.searchsorted(_CAPACITY_BREAKS, self._capacity_used, side="right")
+        ]
+        
+        # token -> bit; one membership bitmask per rep
+        self._specialty_bits, self._specialties = self._token_masks(
+            [rep.specialties for rep in team]
+        )
+        self._territory_bits, self._territories = self._token_masks(
+            [rep.territories for rep in team]
+        )
+        # Reps covering "all" territories match any lead territory
+        self._territory_all_bit = self._territory_bits.get("all", 0)
+        self._rep_index = {rep.rep_id: i for i, rep in enumerate(team)}
+        
+        # Per-rep assignment reason fragments
+        self._reason_because = [f"Assigned to {rep.name} because: " for rep in team]
+        self._reason_default = [
+            f"Assigned to {rep.name} based on best available match" for rep in team
+        ]
+        self._reason_win_rate = [f"{int(rep.win_rate*100)}% win rate" for rep in team]
+    
+    @staticmethod
+    def _token_masks(token_lists: List[Tuple[str, ...]]) -> Tuple[Dict[str, int], np.ndarray]:
+        """Assign each distinct token a bit and OR together the bits each rep lists."""
+        bits: Dict[str, int] = {}
+        for tokens in token_lists:
+            for token in tokens:
+                if token not in bits:
+                    if len(bits) == 63:
+                        raise ValueError("Routing supports at most 63 distinct tokens per field")
+                    bits[token] = 1 << len(bits)
+        masks = np.array(
+            [sum(bits[token] for token in set(tokens)) for tokens in token_lists], dtype=np.int64
+        )
+        return bits, masks
+    
+    def _update_rep_load(self, rep_id: str, delta: int) -> None:
+        """Change a rep's open deal count and refresh the cached capacity used."""
+        i = self._rep_index[rep_id]
+        rep = self.sales_team[i]
+        rep.current_deals += delta
+        self._capacity_used[i] = rep.current_deals / rep.capacity
+        self._capacity_score[i] = _CAPACITY_SCORES[
+            np.searchsorted(_CAPACITY_BREAKS, self._capacity_used[i], side="right")
         ]
     
     def process(
@@ -101,45 +216,7 @@ class RoutingAgent(BaseAgent):
         start_time = self._start_processing()
         
         try:
-            lead_id = input_data.get("lead_id", f"lead-{uuid.uuid4().hex[:8]}")
-            
-            # Score each rep for this lead
-            rep_scores = []
-            for rep in self.sales_team:
-                score = self._score_rep_for_lead(rep, input_data)
-                rep_scores.append({
-                    "rep": rep,
-                    "score": score["total"],
-                    "breakdown": score,
-                })
-            
-            # Sort by score
-            rep_scores.sort(key=lambda x: x["score"], reverse=True)
-            
-            # Select best rep
-            best_match = rep_scores[0]
-            backup_match = rep_scores[1] if len(rep_scores) > 1 else None
-            
-            # Generate assignment
-            assignment = {
-                "lead_id": lead_id,
-                "assigned_to": {
-                    "rep_id": best_match["rep"]["rep_id"],
-                    "name": best_match["rep"]["name"],
-                    "email": best_match["rep"]["email"],
-                },
-                "assignment_score": best_match["score"],
-                "score_breakdown": best_match["breakdown"],
-                "backup_rep": {
-                    "rep_id": backup_match["rep"]["rep_id"],
-                    "name": backup_match["rep"]["name"],
-                } if backup_match else None,
-                "reason": self._generate_assignment_reason(best_match, input_data),
-                "expected_response_time": self._get_expected_response(
-                    best_match["rep"], input_data.get("lead_tier", "COLD")
-                ),
-                "routed_at": datetime.now().isoformat(),
-            }
+            assignment = self._route(input_data, NOW.get())
             
             self._complete_processing(start_time, success=True)
             self._last_output = assignment
@@ -154,100 +231,134 @@ class RoutingAgent(BaseAgent):
             self._complete_processing(start_time, success=False)
             return {"status": "error", "error": str(e)}
     
-    def _score_rep_for_lead(self, rep: Dict, lead: Dict) -> Dict[str, Any]:
-        """Score a rep's fit for this lead."""
-        scores = {
-            "capacity": 0,
-            "expertise": 0,
-            "win_rate": 0,
-            "deal_size_fit": 0,
-            "territory": 0,
-        }
+    def process_batch(self, leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Route many leads at once.
         
-        # Capacity score (0-25) - prefer reps with more bandwidth
-        capacity_used = rep["current_deals"] / rep["capacity"]
-        if capacity_used < 0.5:
-            scores["capacity"] = 25
-        elif capacity_used < 0.7:
-            scores["capacity"] = 20
-        elif capacity_used < 0.9:
-            scores["capacity"] = 10
-        else:
-            scores["capacity"] = 5
+        Same per-lead output as process(); all results share one
+        routed_at timestamp.
+        A lead that fails gets an empty result and its error under
+        "errors" (keyed by position); the other leads are unaffected.
+        """
+        start_time = self._start_processing()
         
-        # Expertise score (0-25) - match industry/segment
-        industry = lead.get("industry", "").lower()
-        company_size = lead.get("company_size", 100)
-        
-        # Determine segment
-        if company_size >= 1000:
-            segment = "enterprise"
-        elif company_size >= 100:
-            segment = "mid_market"
-        elif company_size >= 20:
-            segment = "smb"
-        else:
-            segment = "startup"
+        try:
+            now_iso = NOW.get()
+            results, errors = self._map_isolated(
+                lambda lead: self._route(lead, now_iso), leads, "Routing failed"
+            )
+            
+            self._complete_processing(start_time, success=True)
+            if results:
+                self._last_output = results[-1]
+            
+            return {
+                "status": "success",
+                "routing": results,
+                "errors": errors,
+            }
+            
+        except Exception as e:
+            self._log_error(e, "Batch routing failed")
+            self._complete_processing(start_time, success=False)
+            return {"status": "error", "error": str(e)}
+    
+    def _route(self, input_data: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+        """Pick the best-fit rep (and a backup) for one lead."""
+        lead_id = input_data["lead_id"] if "lead_id" in input_data else f"lead-{os.urandom(4).hex()}"
         
-        if industry in rep["specialties"]:
-            scores["expertise"] += 15
-        if segment in rep["specialties"]:
-            scores["expertise"] += 10
+        # Score every rep for this lead in one pass
+        components, total = self._score_all_reps(input_data)
         
-        # Win rate score (0-20)
-        scores["win_rate"] = int(rep["win_rate"] * 50)  # 0.4 win rate = 20 points
+        # Best and runner-up; no need to rank the whole team
+        best, backup = self._top_two(total)
         
-        # Deal size fit (0-15)
-        deal_size = lead.get("deal_size_estimate", 50000)
-        rep_avg = rep["avg_deal_size"]
+        # Select best rep
+        rep_score = RepScore(*components[:, best].tolist(), int(total[best]))
+        breakdown = rep_score._asdict()
+        best_match = {
+            "rep": self.sales_team[best],
+            "score": rep_score.total,
+            "breakdown": breakdown,
+        }
+        backup_match = {"rep": self.sales_team[backup]} if backup is not None else None
         
-        ratio = min(deal_size, rep_avg) / max(deal_size, rep_avg)
-        scores["deal_size_fit"] = int(ratio * 15)
+        # Generate assignment
+        assignment = {
+            "lead_id": lead_id,
+            "assigned_to": {
+                "rep_id": best_match["rep"].rep_id,
+                "name": best_match["rep"].name,
+                "email": best_match["rep"].email,
+            },
+            "assignment_score": best_match["score"],
+            "score_breakdown": best_match["breakdown"],
+            "backup_rep": {
+                "rep_id": backup_match["rep"].rep_id,
+                "name": backup_match["rep"].name,
+            } if backup_match else None,
+            "reason": self._generate_assignment_reason(best, rep_score, input_data),
+            "expected_response_time": self._get_expected_response(
+                self._capacity_used[best], input_data.get("lead_tier", "COLD")
+            ),
+            "routed_at": now_iso,
+        }
+        
+        return assignment
+    
+    @staticmethod
+    def _top_two(total: np.ndarray) -> Tuple[int, Optional[int]]:
+        """Indices of the highest and second-highest totals; ties go to the earlier rep."""
+        best = int(np.argmax(total))
+        if len(total) < 2:
+            return best, None
+        runner_up = total.copy()
+        runner_up[best] = np.iinfo(runner_up.dtype).min
+        return best, int(np.argmax(runner_up))
+    
+    def _score_all_reps(self, lead: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every rep's fit for this lead.
         
-        # Territory (0-15)
+        Returns the per-component scores (one row per _SCORE_FIELDS entry,
+        one column per rep) and the per-rep totals.
+        """
+        # Lead-side inputs, classified once; the kernel scores every rep against them
+        industry = lead.get("industry", "").lower()
+        segment = _classify_segment(lead.get("company_size", 100))
         territory = lead.get("territory", "").lower()
-        if "all" in rep["territories"] or territory in rep["territories"]:
-            scores["territory"] = 15
-        else:
-            scores["territory"] = 5
         
-        # Total
-        scores["total"] = sum(scores.values())
+        # "+ 0.0" keeps the old TypeError for non-numeric deal sizes
+        deal_size = lead.get("deal_size_estimate", 50000) + 0.0
         
-        return scores
+        return score_reps(
+            self._capacity_score,
+            self._win_rate_score,
+            self._avg_deal_size,
+            self._specialties,
+            self._territories,
+            deal_size,
+            self._specialty_bits.get(industry, 0),
+            self._specialty_bits.get(segment, 0),
+            self._territory_bits.get(territory, 0) | self._territory_all_bit,
+        )
     
-    def _generate_assignment_reason(self, match: Dict, lead: Dict) -> str:
+    def _generate_assignment_reason(self, rep_idx: int, rep_score: RepScore, lead: Dict) -> str:
         """Generate human-readable assignment reason."""
-        rep = match["rep"]
-        breakdown = match["breakdown"]
-        
         reasons = []
         
-        if breakdown["expertise"] >= 20:
+        if rep_score.expertise >= 20:
             reasons.append(f"strong expertise in {lead.get('industry', 'this segment')}")
-        if breakdown["capacity"] >= 20:
+        if rep_score.capacity >= 20:
             reasons.append("has bandwidth for new deals")
-        if breakdown["win_rate"] >= 15:
-            reasons.append(f"{int(rep['win_rate']*100)}% win rate")
+        if rep_score.win_rate >= 15:
+            reasons.append(self._reason_win_rate[rep_idx])
         
         if reasons:
-            return f"Assigned to {rep['name']} because: {', '.join(reasons)}"
+            return self._reason_because[rep_idx] + ", ".join(reasons)
         else:
-            return f"Assigned to {rep['name']} based on best available match"
+            return self._reason_default[rep_idx]
     
-    def _get_expected_response(self, rep: Dict, tier: str) -> str:
+    def _get_expected_response(self, capacity_used: float, tier: str) -> str:
         """Get expected response time based on rep workload and lead tier."""
-        capacity_used = rep["current_deals"] / rep["capacity"]
-        
-        if tier == "HOT":
-            if capacity_used < 0.7:
-                return "Within 5 minutes"
-            else:
-                return "Within 30 minutes"
-        elif tier == "WARM":
-            if capacity_used < 0.7:
-                return "Within 2 hours"
-            else:
-                return "Within 4 hours"
-        else:
-            return "Within 24 hours"
+        return _RESPONSE_TIMES[LeadTier.from_string(tier)][int(capacity_used >= _BUSY_AT)]
@@ -0,0 +1,32 @@
+"""
+ASLOA - Timestamp Cache
+Shared ISO-8601 stamp for record and audit fields. Formatting a fresh
+datetime for every field dominates the cost of small records, so the
+string is rebuilt at most once per millisecond.
+"""
+
+from datetime import datetime
+import time
+
+# Maximum age of a cached stamp, in seconds
+_REFRESH_S = 0.001
+
+
+class _NowCache:
+    """Cached ``datetime.now().isoformat()`` refreshed every millisecond."""
+    __slots__ = ("_t", "_s")
+    
+    def __init__(self):
+        self._t = float("-inf")
+        self._s = ""
+    
+    def get(self) -> str:
+        """Return the current local time as an ISO-8601 string."""
+        t = time.monotonic()
+        if t - self._t > _REFRESH_S:
+            self._s = datetime.now().isoformat()
+            self._t = t
+        return self._s
+
+
+NOW = _NowCache()
@@ -0,0 +1,20 @@
+"""
+ASLOA - JSON Encoding
+Serializes agent results straight to bytes for HTTP/JSON consumers.
+Uses orjson when it is installed and falls back to the stdlib encoder.
+"""
+
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode `obj` as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode()
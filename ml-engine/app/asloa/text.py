@@ -0,0 +1,31 @@
+"""
+ASLOA - Text Keys
+Normalization for the small-vocabulary labels (industry, source) that
+agents use as dict keys, and keyword classifiers for free-text titles.
+"""
+
+from typing import Iterable, Tuple
+import re
+import sys
+
+
+def lower_intern(label: str) -> str:
+    """Lower-case a lookup label (skipping the copy if already lower) and intern it."""
+    return sys.intern(label if label.islower() else label.lower())
+
+
+def first_band_pattern(bands: Iterable[Tuple[str, Iterable[str]]]) -> "re.Pattern[str]":
+    """
+    Compile (name, keywords) bands into one anchored pattern.
+    
+    Each band is a lookahead tried in order, so ``match(text).lastgroup``
+    names the first band with a keyword anywhere in the text -- the same
+    result as a chain of ``any(kw in text for kw in band)`` tests.
+    """
+    return re.compile(
+        "^(?:" + "|".join(
+            f"(?=.*?(?P<{name}>{'|'.join(map(re.escape, words))}))"
+            for name, words in bands
+        ) + ")",
+        re.DOTALL,
+    )
@@ -0,0 +1,19 @@
+"""
+ASLOA - Lead Tiers
+Integer tier codes so hot-path code can index small tables instead of
+hashing and comparing tier labels.
+"""
+
+from enum import IntEnum
+
+
+class LeadTier(IntEnum):
+    """Lead tiers; values index per-tier lookup tables."""
+    COLD = 0
+    WARM = 1
+    HOT = 2
+    
+    @classmethod
+    def from_string(cls, label: str) -> "LeadTier":
+        """Parse a tier label, defaulting to COLD for unknown labels."""
+        return cls.__members__.get(label, cls.COLD)
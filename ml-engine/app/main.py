@@ -3,21 +3,38 @@ AOIA ML Engine - Main Application
 Autonomous Operational Intelligence Agent
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from dotenv import load_dotenv
 import os
 
 from app.api import router as api_router
+from app.asloa import jsonio
 
 load_dotenv()
 
+# orjson renders the large pipeline payloads much faster; it is optional
+DefaultResponse = ORJSONResponse if jsonio.orjson is not None else JSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the ASLOA pipeline (imports, JIT kernels, caches) before serving
+    from app.api.asloa import orchestrator
+    orchestrator.warm_up()
+    yield
+
 app = FastAPI(
     title="AOIA ML Engine",
     description="Autonomous Operational Intelligence Agent - ML & AI Services",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=DefaultResponse,
+    lifespan=lifespan,
 )
 
 # CORS configuration - allow frontend dev servers (Vite)
@@ -73,4 +90,18 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # "auto" picks uvloop/httptools when installed (uvicorn[standard]).
+    # For multi-worker hosts, pin each worker to a NUMA node, e.g.
+    # `numactl --cpunodebind=0 --membind=0 python -m app.main`.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("ML_ENGINE_PORT", "8000")),
+        workers=int(os.getenv("ML_ENGINE_WORKERS", "1")),
+        loop="auto",
+        http="auto",
+        backlog=2048,
+        limit_concurrency=1024,
+        timeout_keep_alive=int(os.getenv("ML_ENGINE_KEEPALIVE", "65")),
+    )
@@ -0,0 +1,24 @@
+"""
+AOIA ML Engine - Batch Clock
+Default timestamp for schema fields. While a request is being ingested
+every model shares one batch timestamp instead of reading the clock per
+instance.
+"""
+
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("batch_now", default=None)
+
+
+def now() -> datetime:
+    """Current batch timestamp, or the wall clock outside a batch."""
+    return _batch_now.get() or datetime.now()
+
+
+def start_batch() -> datetime:
+    """Pin now() to the current time for the rest of this context."""
+    stamp = datetime.now()
+    _batch_now.set(stamp)
+    return stamp
@@ -4,10 +4,20 @@ Domain-agnostic Pydantic models for ANY operational workflow.
 Works across: BPO, SaaS, Retail, Healthcare, Logistics, Agencies, HR, Finance, etc.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, model_validator
+from typing import Optional, List, Dict, Any, Union, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
+
+from app.models.clock import now
+
+# Free-form extension data; nothing downstream inspects it, so it is
+# passed through as-is instead of being walked and copied on validation.
+Metadata = SkipValidation[Optional[Dict[str, Any]]]
+
+# Immutable default for list fields that are only ever read
+_EMPTY_LIST: tuple = ()
 
 
 # ============================================
@@ -90,8 +100,8 @@ class EntityInput(BaseModel):
     belongs_to: Optional[str] = Field(None, description="Parent team/department/zone")
     
     # Industry-specific extensions
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
-    timestamp: Optional[datetime] = Field(default_factory=datetime.now)
+    metadata: Metadata = Field(default_factory=dict)
+    timestamp: Optional[datetime] = Field(default_factory=now)
 
 
 class WorkItemInput(BaseModel):
@@ -132,17 +142,17 @@ class WorkItemInput(BaseModel):
     
     # Assignments
     assigned_to: Optional[str] = Field(None, description="Current assignee entity_id")
-    previous_assignees: Optional[List[str]] = Field(default_factory=list)
+    previous_assignees: Optional[Sequence[str]] = Field(_EMPTY_LIST)
     
     # Process flow
     current_stage: Optional[str] = Field(None, description="Current workflow stage")
-    process_steps: Optional[List[str]] = Field(default_factory=list, description="Steps taken")
+    process_steps: Optional[Sequence[str]] = Field(_EMPTY_LIST, description="Steps taken")
     
     # Value (for financial calculations)
     value: Optional[float] = Field(None, description="Monetary value of this item")
     cost_per_minute: Optional[float] = Field(None, description="Cost per minute for this item type")
     
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
 
 class ProcessInput(BaseModel):
@@ -163,7 +173,7 @@ class ProcessInput(BaseModel):
     active_items_count: Optional[int] = Field(0)
     bottleneck_stage: Optional[str] = Field(None, description="Current bottleneck stage if any")
     
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
 
 class OperationalEvent(BaseModel):
@@ -183,7 +193,7 @@ class OperationalEvent(BaseModel):
     work_item_id: Optional[str] = Field(None, description="Related work item if any")
     
     # When
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=now)
     duration_minutes: Optional[float] = Field(None)
     
     # Details
@@ -191,7 +201,7 @@ class OperationalEvent(BaseModel):
     new_value: Optional[Any] = Field(None)
     description: Optional[str] = Field(None)
     
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
 
 class BusinessContext(BaseModel):
@@ -223,13 +233,32 @@ class BusinessContext(BaseModel):
     available_capacity: Optional[Dict[str, int]] = Field(default_factory=dict)
     working_hours_per_day: Optional[float] = Field(8.0)
     
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    metadata: Metadata = Field(default_factory=dict)
 
 
 # ============================================
 # UNIFIED AOIA INPUT
 # ============================================
 
+# OpenAPI example payload; built once at import and shared by the schema
+_AOIA_EXAMPLE = {
+    "entities": [
+        {"entity_id": "agent-1", "entity_type": "agent", "state": "busy", "load_percent": 95},
+        {"entity_id": "agent-2", "entity_type": "agent", "state": "idle", "idle_time_minutes": 20}
+    ],
+    "work_items": [
+        {"item_id": "TKT-001", "item_type": "ticket", "status": "in_progress", "handover_count": 3, "rework_count": 2}
+    ],
+    "business": {
+        "industry": "BPO",
+        "baseline_resolution_time_minutes": 30,
+        "cost_per_hour": 100,
+        "penalty_per_sla_breach": 500
+    },
+    "autonomy_mode": "FULL_AUTO"
+}
+
+
 class AOIAInput(BaseModel):
     """
     Complete AOIA pipeline input - UNIVERSAL for ANY business workflow.
@@ -254,90 +283,110 @@ class AOIAInput(BaseModel):
     autonomy_mode: Optional[str] = Field("FULL_AUTO", description="ASSIST, COPILOT, or FULL_AUTO")
     dry_run: Optional[bool] = Field(False, description="If true, don't execute actions")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "entities": [
-                    {"entity_id": "agent-1", "entity_type": "agent", "state": "busy", "load_percent": 95},
-                    {"entity_id": "agent-2", "entity_type": "agent", "state": "idle", "idle_time_minutes": 20}
-                ],
-                "work_items": [
-                    {"item_id": "TKT-001", "item_type": "ticket", "status": "in_progress", "handover_count": 3, "rework_count": 2}
-                ],
-                "business": {
-                    "industry": "BPO",
-                    "baseline_resolution_time_minutes": 30,
-                    "cost_per_hour": 100,
-                    "penalty_per_sla_breach": 500
-                },
-                "autonomy_mode": "FULL_AUTO"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _AOIA_EXAMPLE})
 
 
 # ============================================
 # LEGACY COMPATIBILITY (optional use)
 # ============================================
 
-# These exist for backward compatibility but EntityInput/WorkItemInput are preferred
+# These exist for backward compatibility but EntityInput/WorkItemInput are preferred.
+# Nothing in the pipeline uses them, so their validators are built on first use
+# (defer_build) instead of at import.
+
+# Legacy field -> universal field
+_MACHINE_RENAMES = MappingProxyType({
+    "machine_id": "entity_id",
+    "machine_state": "state",
+    "output_per_min": "throughput",
+})
+_WORKFLOW_RENAMES = MappingProxyType({
+    "task_id": "item_id",
+    "task_duration": "duration_minutes",
+    "rework_loops": "rework_count",
+})
+_SHIFT_RENAMES = MappingProxyType({
+    "operator_id": "entity_id",
+    "operator_load": "load_percent",
+})
+# Per-minute legacy fields become hourly values
+_BUSINESS_PER_MIN_RENAMES = MappingProxyType({
+    "baseline_output_per_min": "baseline_throughput",
+    "cost_per_min": "cost_per_hour",
+})
+
+
+def _remap_legacy(data: Any, renames: Mapping[str, str], scale: float = 1) -> Any:
+    """Copy of raw input with legacy keys moved to their universal names."""
+    if not isinstance(data, dict):
+        return data
+    data = dict(data)
+    for old, new in renames.items():
+        if old in data:
+            value = data.pop(old)
+            data[new] = value * scale if scale != 1 else value
+    return data
+
 
 class MachineInput(EntityInput):
     """Legacy alias - use EntityInput with entity_type='machine'."""
+    model_config = ConfigDict(defer_build=True)
+    
     machine_id: Optional[str] = Field(None)
     machine_state: Optional[str] = Field(None)
     output_per_min: Optional[float] = Field(None)
     cycle_time: Optional[float] = Field(None)
     
-    def __init__(self, **data):
-        if 'machine_id' in data:
-            data['entity_id'] = data.pop('machine_id')
-        if 'machine_state' in data:
-            data['state'] = EntityState(data.pop('machine_state'))
-        if 'output_per_min' in data:
-            data['throughput'] = data.pop('output_per_min')
-        data['entity_type'] = EntityType.MACHINE
-        super().__init__(**data)
+    @model_validator(mode="before")
+    @classmethod
+    def _from_legacy(cls, data: Any) -> Any:
+        data = _remap_legacy(data, _MACHINE_RENAMES)
+        if isinstance(data, dict):
+            data["entity_type"] = EntityType.MACHINE
+        return data
 
 
 class WorkflowInput(WorkItemInput):
     """Legacy alias - use WorkItemInput."""
+    model_config = ConfigDict(defer_build=True)
+    
     task_id: Optional[str] = Field(None)
     task_duration: Optional[float] = Field(None)
     rework_loops: Optional[int] = Field(None)
     
-    def __init__(self, **data):
-        if 'task_id' in data:
-            data['item_id'] = data.pop('task_id')
-        if 'task_duration' in data:
-            data['duration_minutes'] = data.pop('task_duration')
-        if 'rework_loops' in data:
-            data['rework_count'] = data.pop('rework_loops')
-        data['item_type'] = 'task'
-        super().__init__(**data)
+    @model_validator(mode="before")
+    @classmethod
+    def _from_legacy(cls, data: Any) -> Any:
+        data = _remap_legacy(data, _WORKFLOW_RENAMES)
+        if isinstance(data, dict):
+            data["item_type"] = "task"
+        return data
 
 
 class ShiftInput(EntityInput):
     """Legacy alias - use EntityInput with entity_type='operator' or 'agent'."""
+    model_config = ConfigDict(defer_build=True)
+    
     operator_id: Optional[str] = Field(None)
     operator_load: Optional[float] = Field(None)
     
-    def __init__(self, **data):
-        if 'operator_id' in data:
-            data['entity_id'] = data.pop('operator_id')
-        if 'operator_load' in data:
-            data['load_percent'] = data.pop('operator_load')
-        data['entity_type'] = EntityType.OPERATOR
-        super().__init__(**data)
+    @model_validator(mode="before")
+    @classmethod
+    def _from_legacy(cls, data: Any) -> Any:
+        data = _remap_legacy(data, _SHIFT_RENAMES)
+        if isinstance(data, dict):
+            data["entity_type"] = EntityType.OPERATOR
+        return data
 
 
 class BusinessInput(BusinessContext):
     """Legacy alias - use BusinessContext."""
+    model_config = ConfigDict(defer_build=True)
+    
     baseline_output_per_min: Optional[float] = Field(None)
     cost_per_min: Optional[float] = Field(None)
     
-    def __init__(self, **data):
-        if 'baseline_output_per_min' in data:
-            data['baseline_throughput'] = data.pop('baseline_output_per_min') * 60
-        if 'cost_per_min' in data:
-            data['cost_per_hour'] = data.pop('cost_per_min') * 60
-        super().__init__(**data)
+    @model_validator(mode="before")
+    @classmethod
+    def _from_legacy(cls, data: Any) -> Any:
+        return _remap_legacy(data, _BUSINESS_PER_MIN_RENAMES, scale=60)
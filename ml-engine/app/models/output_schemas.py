@@ -4,9 +4,16 @@ Domain-agnostic output models for ANY operational workflow.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic.dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Sequence
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+
+from app.models.clock import now
+
+# Shared default for read-only list fields; avoids a fresh list per instance
+_EMPTY_LIST: tuple = ()
 
 
 class SeverityLevel(str, Enum):
@@ -97,13 +104,13 @@ class InefficiencyDetection(BaseModel):
     
     # IMPACT
     affected_items_count: Optional[int] = Field(0, description="Number of work items affected")
-    downstream_impact: Optional[List[str]] = Field(default_factory=list)
+    downstream_impact: Optional[Sequence[str]] = Field(_EMPTY_LIST)
     
     # DETAILS
     description: str = Field(...)
-    evidence: Optional[List[str]] = Field(default_factory=list)
+    evidence: Optional[Sequence[str]] = Field(_EMPTY_LIST)
     
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=now)
     
     # Legacy compatibility
     @property
@@ -115,7 +122,10 @@ class InefficiencyDetection(BaseModel):
         return self.location_id
 
 
-class CausalStep(BaseModel):
+# Small leaf records built many times per run are slotted pydantic
+# dataclasses: same validation, no per-instance __dict__.
+@dataclass(slots=True)
+class CausalStep:
     """Single step in a causal chain."""
     step_number: int
     cause: str
@@ -145,19 +155,27 @@ class RootCauseExplanation(BaseModel):
     probability_of_correctness: float = Field(..., ge=0, le=1)
     evidence: List[str] = Field(default_factory=list)
     
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=now)
     
-    # Legacy compatibility
-    @property
+    # Legacy compatibility (filtered once per instance, then cached)
+    @cached_property
+    def _lowered_entities(self) -> List[str]:
+        return [e.lower() for e in self.impacted_entities]
+    
+    @cached_property
     def impacted_machines(self) -> List[str]:
-        return [e for e in self.impacted_entities if 'machine' in e.lower()]
+        return [e for e, low in zip(self.impacted_entities, self._lowered_entities) if 'machine' in low]
     
-    @property
+    @cached_property
     def impacted_operators(self) -> List[str]:
-        return [e for e in self.impacted_entities if any(x in e.lower() for x in ['agent', 'operator', 'employee'])]
+        return [
+            e for e, low in zip(self.impacted_entities, self._lowered_entities)
+            if 'agent' in low or 'operator' in low or 'employee' in low
+        ]
 
 
-class LossBreakdown(BaseModel):
+@dataclass(slots=True)
+class LossBreakdown:
     """Breakdown of financial loss calculation."""
     base_loss: float = Field(0)
     industry_adjustment: float = Field(0)
@@ -191,7 +209,7 @@ class FinancialLoss(BaseModel):
     
     confidence: float = Field(..., ge=0, le=1)
     methodology: str = Field(...)
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=now)
     
     # Legacy compatibility
     @property
@@ -274,10 +292,10 @@ class OptimizationPlan(BaseModel):
     risk_assessment: Dict[str, Any] = Field(default_factory=dict)
     
     # Implementation
-    implementation_steps: List[str] = Field(default_factory=list)
+    implementation_steps: Sequence[str] = Field(_EMPTY_LIST)
     estimated_time_to_implement: Optional[str] = Field(None)
     
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=now)
 
 
 class ExecutionAction(BaseModel):
@@ -299,7 +317,7 @@ class ExecutionAction(BaseModel):
     error: Optional[str] = Field(None)
     
     # Timing
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=now)
     executed_at: Optional[datetime] = Field(None)
     completed_at: Optional[datetime] = Field(None)
     
@@ -311,7 +329,8 @@ class ExecutionAction(BaseModel):
         return self.target_id
 
 
-class UpdatedBaselines(BaseModel):
+@dataclass(slots=True)
+class UpdatedBaselines:
     """Updated baselines from learning."""
     baseline_updates: Dict[str, float] = Field(default_factory=dict)
     threshold_updates: Dict[str, float] = Field(default_factory=dict)
@@ -347,6 +366,7 @@ class AOIAOutput(BaseModel):
     autonomy_mode: str = Field(...)
     industry: str = Field("GENERAL", description="Industry context")
     processing_time_ms: float = Field(...)
-    timestamp: datetime = Field(default_factory=datetime.now)
+    stage_timings_ms: Dict[str, float] = Field(default_factory=dict, description="Per-stage latency")
+    timestamp: datetime = Field(default_factory=now)
     status: str = Field("completed")
     errors: List[str] = Field(default_factory=list)
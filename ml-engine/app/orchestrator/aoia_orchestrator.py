@@ -3,13 +3,19 @@ AOIA ML Engine - Universal Orchestrator
 Coordinates all agents for ANY operational workflow.
 
 Works across: BPO, SaaS, Retail, Healthcare, Logistics, Agencies, HR, Finance, etc.
+
+Loss estimation only needs the detections and business context, so it
+runs alongside the knowledge graph and root-cause steps.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import contextvars
 import uuid
 import logging
 import json
+import time
 
 from app.orchestrator.autonomy_modes import AutonomyMode, ModeConfig
 from app.agents.detection_agent import DetectionAgent
@@ -17,6 +23,7 @@ from app.agents.knowledge_graph_agent import KnowledgeGraphAgent
 from app.agents.loss_estimation_agent import LossEstimationAgent
 from app.agents.optimizer_agent import OptimizerAgent
 from app.agents.reasoning_agent import ReasoningAgent
+from app.models.clock import now
 from app.models.output_schemas import (
     AOIAOutput, 
     InefficiencyDetection,
@@ -58,6 +65,9 @@ class AOIAOrchestrator:
         self.optimizer_agent = OptimizerAgent()
         self.reasoning_agent = ReasoningAgent()
         
+        # Runs loss estimation while the graph and root causes are built
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aoia")
+        
         # Current autonomy mode
         self._mode = AutonomyMode.FULL_AUTO
         
@@ -97,6 +107,8 @@ class AOIAOrchestrator:
         start_time = datetime.now()
         self._pipeline_id = f"pipeline-{uuid.uuid4().hex[:12]}"
         errors: List[str] = []
+        stage_times: Dict[str, float] = {}
+        mark = time.perf_counter()
         
         # Extract settings
         mode_str = input_data.get("autonomy_mode", self._mode.value)
@@ -115,6 +127,7 @@ class AOIAOrchestrator:
             # Step 1: Normalize input (support legacy formats)
             # ============================================
             normalized_data = self._normalize_input(input_data)
+            mark = self._lap(stage_times, "normalize", mark)
             
             # ============================================
             # Step 2: Detection Agent - find inefficiencies
@@ -124,6 +137,19 @@ class AOIAOrchestrator:
             
             if detection_result.get("status") == "error":
                 errors.append(f"Detection: {detection_result.get('error')}")
+            mark = self._lap(stage_times, "detect", mark)
+            
+            # ============================================
+            # Step 5 (started early): Loss Estimation Agent - calculate impact
+            # ============================================
+            loss_input = {
+                "detections": detections,
+                "business": normalized_data.get("business", {}),
+            }
+            # copy_context keeps the request's shared clock in the worker
+            loss_future = self._pool.submit(
+                contextvars.copy_context().run, self.loss_estimation_agent.process, loss_input
+            )
             
             # ============================================
             # Step 3: Knowledge Graph Agent - map dependencies
@@ -136,24 +162,23 @@ class AOIAOrchestrator:
             
             if kg_result.get("status") == "error":
                 errors.append(f"KnowledgeGraph: {kg_result.get('error')}")
+            mark = self._lap(stage_times, "knowledge_graph", mark)
             
             # ============================================
             # Step 4: Reasoning Agent - explain root causes
             # ============================================
             root_causes = self._generate_root_causes(detections, affected_nodes)
+            mark = self._lap(stage_times, "root_cause", mark)
             
             # ============================================
-            # Step 5: Loss Estimation Agent - calculate impact
+            # Step 5: collect loss estimate (stage time is the wait left)
             # ============================================
-            loss_input = {
-                "detections": detections,
-                "business": normalized_data.get("business", {}),
-            }
-            loss_result = self.loss_estimation_agent.process(loss_input)
+            loss_result = loss_future.result()
             financial_loss = loss_result.get("financial_loss")
             
             if loss_result.get("status") == "error":
                 errors.append(f"LossEstimation: {loss_result.get('error')}")
+            mark = self._lap(stage_times, "loss", mark)
             
             # ============================================
             # Step 6: Optimizer Agent - generate plan
@@ -161,6 +186,7 @@ class AOIAOrchestrator:
             optimization_plan = self._generate_optimization_plan(
                 detections, root_causes, financial_loss
             )
+            mark = self._lap(stage_times, "optimize", mark)
             
             # ============================================
             # Step 7: Execution (if mode allows)
@@ -173,11 +199,13 @@ class AOIAOrchestrator:
                     actions_executed = self._create_pending_actions(optimization_plan, detections)
                 else:
                     actions_executed = self._execute_actions(optimization_plan, detections)
+            mark = self._lap(stage_times, "execute", mark)
             
             # ============================================
             # Step 8: Learn and update baselines
             # ============================================
             updated_baselines = self._learn_from_results(detections, actions_executed)
+            self._lap(stage_times, "learn", mark)
             
             # Build output
             processing_time = (datetime.now() - start_time).total_seconds() * 1000
@@ -193,6 +221,7 @@ class AOIAOrchestrator:
                 autonomy_mode=self._mode.value,
                 industry=self._industry,
                 processing_time_ms=processing_time,
+                stage_timings_ms=stage_times,
                 timestamp=datetime.now(),
                 status="completed" if not errors else "completed_with_errors",
                 errors=errors,
@@ -216,11 +245,18 @@ class AOIAOrchestrator:
                 autonomy_mode=self._mode.value,
                 industry=self._industry,
                 processing_time_ms=processing_time,
+                stage_timings_ms=stage_times,
                 timestamp=datetime.now(),
                 status="failed",
                 errors=[str(e)],
             )
     
+    def _lap(self, stage_times: Dict[str, float], stage: str, mark: float) -> float:
+        """Record elapsed milliseconds for a pipeline stage and return a new mark."""
+        tick = time.perf_counter()
+        stage_times[stage] = (tick - mark) * 1000
+        return tick
+    
     def _normalize_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize input - support both new universal format and legacy format."""
         # New universal format
@@ -695,6 +731,7 @@ class AOIAOrchestrator:
                     else SeverityLevel.HIGH if severity < 0.85
                     else SeverityLevel.CRITICAL
                 )
+                stamp = now()
                 
                 result.append(InefficiencyDetection(
                     detection_id=d.get("detection_id", f"det-{uuid.uuid4().hex[:8]}"),
@@ -704,12 +741,12 @@ class AOIAOrchestrator:
                     location_name=d.get("location_name"),
                     severity_score=severity,
                     severity_level=severity_level,
-                    time_window=d.get("time_window", {"start": datetime.now(), "end": datetime.now()}),
+                    time_window=d["time_window"] if "time_window" in d else {"start": stamp, "end": stamp},
                     deviation_percent=d.get("deviation_percent", 0),
                     current_value=d.get("current_value"),
                     expected_value=d.get("expected_value"),
                     description=d.get("description", ""),
-                    timestamp=datetime.now(),
+                    timestamp=stamp,
                 ))
             except Exception:
                 continue
@@ -34,6 +34,13 @@ class AnomalyDetector:
             "MACHINE_SPEED": {"low": 70, "high": None},
             "ERROR_RATE": {"low": None, "high": 5},
         }
+        self._bands = {
+            mtype: (
+                band["low"] if band["low"] is not None else -np.inf,
+                band["high"] if band["high"] is not None else np.inf,
+            )
+            for mtype, band in self.thresholds.items()
+        }
     
     def detect_batch(
         self, 
@@ -51,22 +58,25 @@ class AnomalyDetector:
             List of detection results
         """
         results = []
+        if not metrics:
+            return results
         
-        # Group metrics by type for contextual analysis
-        by_type: Dict[str, List[Any]] = {}
-        for metric in metrics:
-            mtype = metric.metric_type
-            if mtype not in by_type:
-                by_type[mtype] = []
-            by_type[mtype].append(metric)
+        types = np.array([m.metric_type for m in metrics])
+        values = np.array([m.value for m in metrics], dtype=float)
+        
+        # Group statistics per metric type, computed once over the full batch
+        stats: Dict[str, tuple] = {}
+        for mtype in np.unique(types):
+            group = values[types == mtype]
+            stats[mtype] = (group.mean(), group.std() if len(group) > 1 else 0)
         
-        for metric in metrics:
+        # In-band values are normal by policy; only the residual subset is scored
+        candidates = self._out_of_band_mask(types, values)
+        
+        for idx in np.flatnonzero(candidates):
+            metric = metrics[idx]
             mtype = metric.metric_type
-            values = [m.value for m in by_type[mtype]]
-            
-            # Calculate statistics
-            mean_val = np.mean(values)
-            std_val = np.std(values) if len(values) > 1 else 0
+            mean_val, std_val = stats[mtype]
             
             # Determine if anomaly using multiple methods
             is_anomaly = False
@@ -97,7 +107,7 @@ class AnomalyDetector:
                     "score": round(score, 3),
                     "severity": severity,
                     "description": self._generate_description(metric, deviation),
-                    "expected_value": round(mean_val, 2),
+                    "expected_value": round(float(mean_val), 2),
                     "deviation_percent": round(deviation, 2),
                     "metric": metric,
                 })
@@ -111,6 +121,7 @@ class AnomalyDetector:
     ) -> Dict[str, Any]:
         """
         Detect anomaly for a single metric with optional context.
+        Unlike detect_batch, in-band values are not short-circuited here.
         
         Args:
             metric: Single MetricData object
@@ -183,6 +194,16 @@ class AnomalyDetector:
             print(f"Training error: {e}")
             return False
     
+    def _out_of_band_mask(self, types: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Mark metrics outside their static band; types without a band always pass."""
+        mask = np.ones(len(values), dtype=bool)
+        for mtype, (low, high) in self._bands.items():
+            in_type = types == mtype
+            if in_type.any():
+                group = values[in_type]
+                mask[in_type] = (group < low) | (group > high)
+        return mask
+    
     def _calculate_severity(self, score: float, deviation: float) -> str:
         """Calculate severity based on anomaly score and deviation."""
         abs_dev = abs(deviation)
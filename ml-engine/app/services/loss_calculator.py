@@ -3,7 +3,25 @@ AOIA ML Engine - Loss Calculator Service
 Quantifies operational inefficiencies in monetary terms.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import numpy as np
+
+
+def sum_by_key(keys: List[str], values: List[float]) -> Dict[str, float]:
+    """
+    Total values per key, keys in first-seen order.
+    
+    Keys are interned to dense ids and summed with one np.bincount
+    pass; bincount adds in input order, so each total matches a
+    sequential running sum.
+    """
+    index: Dict[str, int] = {}
+    ids = np.fromiter(
+        (index.setdefault(key, len(index)) for key in keys), dtype=np.intp, count=len(keys)
+    )
+    sums = np.bincount(ids, weights=np.asarray(values, dtype=np.float64), minlength=len(index))
+    return dict(zip(index, sums.tolist()))
 
 
 class LossCalculator:
@@ -104,8 +122,7 @@ class LossCalculator:
         Calculate total loss for multiple anomalies.
         """
         total_loss = 0
-        by_type = {}
-        by_source = {}
+        losses = []
         
         for anomaly in anomalies:
             result = self.calculate(
@@ -119,12 +136,10 @@ class LossCalculator:
             
             loss = result["estimated_loss"]
             total_loss += loss
-            
-            atype = anomaly.get("anomaly_type", "UNKNOWN")
-            source = anomaly.get("source", "unknown")
-            
-            by_type[atype] = by_type.get(atype, 0) + loss
-            by_source[source] = by_source.get(source, 0) + loss
+            losses.append(loss)
+        
+        by_type = sum_by_key([a.get("anomaly_type", "UNKNOWN") for a in anomalies], losses)
+        by_source = sum_by_key([a.get("source", "unknown") for a in anomalies], losses)
         
         return {
             "total_loss": round(total_loss, 2),
@@ -3,7 +3,12 @@ AOIA Universal Pipeline Test
 Tests across MULTIPLE industries - NOT just machines!
 """
 
+import copy
+
 from app.orchestrator import AOIAOrchestrator
+from app.asloa.orchestrator import ASLOAOrchestrator
+from app.asloa.agents.lead_scoring_agent import LeadScoringAgent
+from app.asloa.agents.qualification_agent import QualificationAgent
 
 def test_bpo_scenario():
     """Test BPO call center scenario."""
@@ -157,6 +162,127 @@ def test_legacy_format():
     return result
 
 
+def test_batch_scoring_null_company_size():
+    """Batch scoring rejects a null company size per lead, like process()."""
+    agent = LeadScoringAgent()
+    null_lead = {"lead_id": "lead-null", "company": "Nully", "company_size": None,
+                 "industry": "saas", "contact_title": "CTO", "source": "referral"}
+    valid_lead = dict(null_lead, lead_id="lead-ok", company_size=250)
+    
+    single = agent.process(dict(null_lead))
+    batch = agent.process_batch([dict(null_lead), dict(valid_lead)])
+    
+    assert single["status"] == "error"
+    assert batch["status"] == "success"
+    assert batch["scoring"][0] == {}
+    assert batch["errors"] == {0: single["error"]}
+    assert batch["scoring"][1]["score"] == agent.process(dict(valid_lead))["scoring"]["score"]
+
+
+def test_batch_scoring_null_text_fields():
+    """A null industry or engagement_signals fails only that lead in batch scoring."""
+    agent = LeadScoringAgent()
+    valid_lead = {"lead_id": "lead-ok", "company": "Acme", "company_size": 250, "industry": "saas",
+                  "contact_title": "CTO", "source": "referral", "engagement_signals": ["requested_demo"]}
+    null_industry = dict(valid_lead, lead_id="lead-null-industry", industry=None)
+    null_signals = dict(valid_lead, lead_id="lead-null-signals", engagement_signals=None)
+    
+    batch = agent.process_batch([dict(null_industry), dict(valid_lead), dict(null_signals)])
+    
+    assert batch["status"] == "success"
+    assert batch["errors"] == {
+        0: agent.process(dict(null_industry))["error"],
+        2: agent.process(dict(null_signals))["error"],
+    }
+    assert batch["scoring"][0] == batch["scoring"][2] == {}
+    assert batch["scoring"][1]["score"] == agent.process(dict(valid_lead))["scoring"]["score"]
+
+def test_batch_qualification_null_budget():
+    """Batch qualification rejects a null budget, title or pain points per lead, like process()."""
+    agent = QualificationAgent()
+    valid_lead = {"lead_id": "lead-ok", "budget": 50000, "contact_title": "VP Sales",
+                  "pain_points": ["manual reporting"], "timeline": 30}
+    null_leads = [
+        dict(valid_lead, lead_id="lead-null-budget", budget=None),
+        dict(valid_lead, lead_id="lead-null-title", contact_title=None),
+        dict(valid_lead, lead_id="lead-null-pain", pain_points=None),
+    ]
+    
+    singles = [agent.process(dict(lead)) for lead in null_leads]
+    assert all(single["status"] == "error" for single in singles)
+    
+    for include_analysis in (True, False):
+        batch = agent.process_batch([dict(lead) for lead in null_leads + [valid_lead]], include_analysis)
+        assert batch["status"] == "success"
+        assert batch["qualification"][:3] == [{}, {}, {}]
+        assert batch["errors"] == {i: single["error"] for i, single in enumerate(singles)}
+        assert batch["qualification"][3]["qualification_status"] == "QUALIFIED"
+
+def test_research_cache_returns_copies():
+    """Mutating a cached research result leaves the cache untouched."""
+    orchestrator = ASLOAOrchestrator()
+    lead = {"lead_id": "lead-cache", "company": "Acme", "company_size": 500, "industry": "technology",
+            "pain_points": ["slow deployment cycles"], "funding_raised": True}
+    research_input = orchestrator._research_input(lead)
+    
+    first = orchestrator._cached_research(research_input)["research"]
+    expected = copy.deepcopy(first)
+    first["pain_points"].append("mutated")
+    first["company_profile"]["mutated"] = True
+    
+    assert orchestrator._cached_research(research_input)["research"] == expected
+    batch = orchestrator._cached_research_batch([research_input, research_input])["research"]
+    batch[0]["pain_points"].append("mutated")
+    assert batch[1] == expected
+    assert orchestrator._cached_research(research_input)["research"] == expected
+
+
+def _stable(result):
+    """Pipeline result without generated ids, timings and timestamps."""
+    if isinstance(result, dict):
+        return {
+            k: _stable(v) for k, v in result.items()
+            if k not in ("processing_time_ms", "timestamp", "depends_on")
+            and not k.endswith("_at")
+            and not (k.endswith("_id") and k != "lead_id")
+        }
+    if isinstance(result, list):
+        return [_stable(v) for v in result]
+    return result
+
+
+def test_batch_matches_process_lead():
+    """process_leads_batch() gives every lead the same result as process_lead()."""
+    hot = {"lead_id": "lead-hot", "company": "Acme", "company_size": 500, "industry": "technology",
+           "contact_name": "Ana Bell", "contact_title": "CTO", "contact_email": "ana@acme.com",
+           "source": "referral", "budget": 150000, "deal_size_estimate": 120000,
+           "pain_points": ["scaling issues"], "timeline": 30, "territory": "west"}
+    cold = {"lead_id": "lead-cold", "company": "Tiny", "company_size": 2, "industry": "other",
+            "contact_name": "Cy Dee", "contact_title": "Intern", "contact_email": "cy@tiny.com",
+            "source": "cold_call", "timeline": 365}
+    null_fields = dict(hot, lead_id="lead-null", company="Nully", company_size=None, budget=None)
+    null_text = dict(hot, lead_id="lead-null-text", company="Blank", industry=None,
+                     contact_title=None, pain_points=None)
+    leads = [hot, cold, null_fields, null_text]
+    
+    batch_orchestrator, single_orchestrator = ASLOAOrchestrator(), ASLOAOrchestrator()
+    batch_orchestrator.outreach._rng.seed(0)
+    single_orchestrator.outreach._rng.seed(0)
+    
+    batch = batch_orchestrator.process_leads_batch([dict(lead) for lead in leads])
+    single = [single_orchestrator.process_lead(dict(lead)) for lead in leads]
+    
+    assert batch[0]["status"] == "completed"
+    assert batch[0]["routing"].get("assigned_to")
+    assert batch[1]["scoring"]["score"] < batch_orchestrator.cold_lead_threshold
+    assert batch[2]["status"] == "completed_with_errors"
+    assert batch[3]["status"] == "completed_with_errors"
+    for i in (0, 1):
+        assert not batch[i]["errors"]
+        assert batch[i]["scoring"]["score"] == single[i]["scoring"]["score"]
+    assert [_stable(r) for r in batch] == [_stable(r) for r in single]
+
+
 def print_results(result):
     """Print formatted results."""
     print(f"\n[RESULT] Pipeline: {result.pipeline_id}")